@@ -10,9 +10,14 @@ Created on Wed Aug 26 09:56:40 2020
 # =============================================================================
 # Imports
 # =============================================================================
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import io
+from pathlib import Path
 import zipfile
+
 from mth5 import read_file
 from mth5 import mth5
+from mth5.timeseries import RunTS
 
 from mt_metadata import timeseries as metadata
 from mt_metadata.utils.mttime import MTime
@@ -22,69 +27,102 @@ from mt_metadata.utils.mttime import MTime
 # =============================================================================
 
 
-# set to true if you want to interact with the mth5 object in the console
-interact = False
-nims_dir = "path/to/nims/file.bin"
-h5_fn = "from_nims.mth5"
-
-if h5_fn.exists():
-    h5_fn.unlink()
-    print(f"INFO: Removed existing file {h5_fn}")
-
-# need to unzip the data
-with zipfile.ZipFile(nims_dir.joinpath("nims.zip"), "r") as zip_ref:
-    zip_ref.extractall(nims_dir)
-
-processing_start = MTime()
-processing_start.now()
-
-# write some simple metadata for the survey
-survey = metadata.Survey()
-survey.acquired_by.author = "MT Master"
-survey.archive_id = "TST01"
-survey.archive_network = "MT"
-survey.name = "test"
-
-m = mth5.MTH5()
-m.open_mth5(h5_fn, "w")
-
-# add survey metadata
-survey_group = m.survey_group
-survey_group.metadata.from_dict(survey.to_dict())
-survey_group.write_metadata()
-
-for nims_fn in zip_ref.filelist:
-
-    run_ts = read_file(nims_dir.joinpath(nims_fn.filename))
-
-    # initialize a station
-    station_group = m.add_station(
-        run_ts.station_metadata.id, station_metadata=run_ts.station_metadata
-    )
-
-    # make a run group
-    run_group = station_group.add_run(
-        run_ts.run_metadata.id, run_metadata=run_ts.run_metadata
-    )
-
-    # add data to the run group
-    channels = run_group.from_runts(run_ts)
-
-    # validate run metadata
-    run_group.validate_run_metadata()
+def read_nims_run(zip_fn, entry_name):
+    """
+    Read a single NIMS file straight out of the zip archive, this runs in a
+    worker process.  Nothing is extracted to disk, the entry is read through
+    a 64 KiB buffer.
+
+    RunTS objects do not pickle, so send back the dataset and metadata and
+    rebuild the RunTS in the main process.
+    """
+    with zipfile.ZipFile(zip_fn, "r") as zip_ref:
+        with zip_ref.open(entry_name) as raw:
+            run_ts = read_file(io.BufferedReader(raw, buffer_size=65536))
+    return run_ts.dataset, run_ts.run_metadata, run_ts.station_metadata
+
+
+if __name__ == "__main__":
+    # set to true if you want to interact with the mth5 object in the console
+    interact = False
+    nims_dir = Path("path/to/nims")
+    h5_fn = Path("from_nims.mth5")
+
+    if h5_fn.exists():
+        h5_fn.unlink()
+        print(f"INFO: Removed existing file {h5_fn}")
+
+    # the data are read directly from the archive
+    zip_fn = nims_dir.joinpath("nims.zip")
+    with zipfile.ZipFile(zip_fn, "r") as zip_ref:
+        entry_names = [info.filename for info in zip_ref.infolist()]
+
+    processing_start = MTime()
+    processing_start.now()
+
+    # write some simple metadata for the survey
+    survey = metadata.Survey()
+    survey.acquired_by.author = "MT Master"
+    survey.archive_id = "TST01"
+    survey.archive_network = "MT"
+    survey.name = "test"
+
+    m = mth5.MTH5()
+    m.open_mth5(h5_fn, "w")
+
+    # add survey metadata
+    survey_group = m.survey_group
+    survey_group.metadata.from_dict(survey.to_dict())
+    survey_group.write_metadata()
+
+    # read and parse the files in parallel, the HDF5 file only has one writer
+    # so the runs are written from the main process as each file finishes.
+    # station metadata depend on all the runs, so only validate them once
+    # after all the runs are added.
+    station_groups = {}
+    with ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(read_nims_run, zip_fn, entry_name)
+            for entry_name in entry_names
+        ]
+
+        for future in as_completed(futures):
+            dataset, run_metadata, station_metadata = future.result()
+            run_ts = RunTS(
+                dataset,
+                run_metadata=run_metadata,
+                station_metadata=station_metadata,
+            )
+
+            # initialize a station
+            station_id = run_ts.station_metadata.id
+            if station_id not in station_groups:
+                station_groups[station_id] = m.add_station(
+                    station_id, station_metadata=run_ts.station_metadata,
+                )
+            station_group = station_groups[station_id]
+
+            # make a run group
+            run_group = station_group.add_run(
+                run_ts.run_metadata.id, run_metadata=run_ts.run_metadata
+            )
+
+            # add data to the run group, this also validates the run metadata
+            channels = run_group.from_runts(run_ts)
 
     # update station metadata to ensure consistency
-    station_group.validate_station_metadata()
+    for station_group in station_groups.values():
+        station_group.validate_station_metadata()
 
-survey_group.update_survey_metadata()
+    survey_group.update_survey_metadata()
 
-processing_end = MTime()
-processing_end.now()
+    processing_end = MTime()
+    processing_end.now()
 
-print(
-    f"Making MTH5 file took {(processing_end - processing_start) // 60:02.0f}:"
-    f"{(processing_end - processing_start) % 60:02.0f} minutes"
-)
+    print(
+        f"Making MTH5 file took {(processing_end - processing_start) // 60:02.0f}:"
+        f"{(processing_end - processing_start) % 60:02.0f} minutes"
+    )
 
-if not interact:
-    m.close_mth5()
+    if not interact:
+        m.close_mth5()
@@ -16,8 +16,7 @@ Created on Fri May 29 15:09:48 2020
 # =============================================================================
 # Imports
 # =============================================================================
-import inspect
-import weakref
+import logging
 
 import h5py
 
@@ -27,12 +26,47 @@ from mt_metadata.base import Base
 
 from mth5.helpers import get_tree
 from mth5.utils.exceptions import MTH5Error
-from mth5.helpers import to_numpy_type, from_numpy_type
+from mth5.helpers import (
+    to_numpy_type,
+    from_numpy_type,
+    get_module_classes,
+    set_attribute,
+    copy_metadata,
+    metadata_items,
+)
 from mth5.utils.mth5_logger import setup_logger
 
 # make a dictionary of available metadata classes
-meta_classes = dict(inspect.getmembers(metadata, inspect.isclass))
+meta_classes = dict(get_module_classes(metadata))
 meta_classes["TransferFunction"] = TransferFunction
+
+# descriptors of the attributes MTH5 adds to every group's metadata
+_BASE_ATTR_TEMPLATES = {
+    "mth5_type": {
+        "type": str,
+        "required": True,
+        "style": "free form",
+        "description": "type of group",
+        "units": None,
+        "options": [],
+        "alias": [],
+        "example": "group_name",
+        "default": None,
+    },
+    "hdf5_reference": {
+        "type": "h5py_reference",
+        "required": True,
+        "style": "free form",
+        "description": "hdf5 internal reference",
+        "units": None,
+        "options": [],
+        "alias": [],
+        "example": "<HDF5 Group Reference>",
+        "default": "none",
+    },
+}
+
+
 # =============================================================================
 #
 # =============================================================================
@@ -74,18 +108,16 @@ class BaseGroup:
 
     """
 
-    def __init__(self, group, group_metadata=None, **kwargs):
-        self.compression = None
+    def __init__(self, group, group_metadata=None, write_metadata=True, **kwargs):
+        # numeric time series compress well with shuffle + lzf at very little
+        # cost, overwrite with keyword arguments for text or object datasets.
+        self.compression = "lzf"
         self.compression_opts = None
-        self.shuffle = False
+        self.shuffle = True
         self.fletcher32 = False
 
-        self.logger = setup_logger(f"{__name__}.{self._class_name}")
-
-        # make sure the reference to the group is weak so there are no lingering
-        # references to a closed HDF5 file.
         if group is not None and isinstance(group, (h5py.Group, h5py.Dataset)):
-            self.hdf5_group = weakref.ref(group)()
+            self.hdf5_group = group
 
         # initialize metadata
         self._initialize_metadata()
@@ -94,8 +126,10 @@ class BaseGroup:
         if group_metadata is not None:
             self.metadata = group_metadata
 
-            # write out metadata to make sure that its in the file.
-            self.write_metadata()
+            # write out metadata to make sure that its in the file, skip if
+            # the caller writes it right after, like initialize_group.
+            if write_metadata:
+                self.write_metadata()
         else:
             self.read_metadata()
 
@@ -123,9 +157,15 @@ class BaseGroup:
     def __iter__(self):
         return self.hdf5_group.items().__iter__()
 
-    @property
-    def _class_name(self):
-        return self.__class__.__name__.split("Group")[0]
+    # the class name and logger do not change, so set them once for each
+    # subclass
+    _class_name = "Base"
+    logger = setup_logger(f"{__name__}.Base")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._class_name = cls.__name__.split("Group")[0]
+        cls.logger = setup_logger(f"{__name__}.{cls._class_name}")
 
     def _initialize_metadata(self):
         """
@@ -145,38 +185,19 @@ class BaseGroup:
 
         # add 2 attributes that will help with querying
         # 1) the metadata class name
-        self._metadata.add_base_attribute(
-            "mth5_type",
-            self._class_name.split("Group")[0],
-            {
-                "type": str,
-                "required": True,
-                "style": "free form",
-                "description": "type of group",
-                "units": None,
-                "options": [],
-                "alias": [],
-                "example": "group_name",
-                "default": None,
-            },
-        )
-
         # 2) the HDF5 reference that can be used instead of paths
-        self._metadata.add_base_attribute(
-            "hdf5_reference",
-            self.hdf5_group.ref,
-            {
-                "type": "h5py_reference",
-                "required": True,
-                "style": "free form",
-                "description": "hdf5 internal reference",
-                "units": None,
-                "options": [],
-                "alias": [],
-                "example": "<HDF5 Group Reference>",
-                "default": "none",
-            },
-        )
+        base_values = {
+            "mth5_type": self._class_name.split("Group")[0],
+            "hdf5_reference": self.hdf5_group.ref,
+        }
+        for name, value in base_values.items():
+            # only register the attribute if the schema does not already
+            # hold the MTH5 descriptor
+            template = _BASE_ATTR_TEMPLATES[name]
+            if self._metadata._attr_dict.get(name) is template:
+                self._metadata.set_attr_from_name(name, value)
+            else:
+                self._metadata.add_base_attribute(name, value, template)
 
     @property
     def metadata(self):
@@ -203,7 +224,8 @@ class BaseGroup:
             self.logger.error(msg)
             raise MTH5Error(msg)
 
-        self._metadata.from_dict(metadata_object.to_dict())
+        if not copy_metadata(metadata_object, self._metadata):
+            self._metadata.from_dict(metadata_object.to_dict())
 
         self._metadata.mth5_type = self._class_name
         self._metadata.hdf5_reference = self.hdf5_group.ref
@@ -226,9 +248,9 @@ class BaseGroup:
         read metadata from the HDF5 group into metadata object
 
         """
-        meta_dict = dict(self.hdf5_group.attrs)
-        for key, value in meta_dict.items():
-            meta_dict[key] = from_numpy_type(value)
+        meta_dict = {
+            key: from_numpy_type(value) for key, value in self.hdf5_group.attrs.items()
+        }
         self.metadata.from_dict({self._class_name: meta_dict})
 
     def write_metadata(self):
@@ -237,10 +259,17 @@ class BaseGroup:
 
         """
 
-        for key, value in self.metadata.to_dict(single=True).items():
-            value = to_numpy_type(value)
-            self.logger.debug("wrote metadata {0} = {1}".format(key, value))
-            self.hdf5_group.attrs.create(key, value)
+        # convert everything up front so the write loop only talks to HDF5
+        meta_items = [
+            (key, to_numpy_type(value)) for key, value in metadata_items(self.metadata)
+        ]
+        debug_on = self.logger.isEnabledFor(logging.DEBUG)
+
+        attrs = self.hdf5_group.attrs
+        for key, value in meta_items:
+            set_attribute(attrs, key, value)
+            if debug_on:
+                self.logger.debug("wrote metadata %s = %s", key, value)
 
     def initialize_group(self, **kwargs):
         """
@@ -8,8 +8,6 @@ Created on Thu Mar 10 09:02:16 2022
 # =============================================================================
 # Imports
 # =============================================================================
-import weakref
-
 import h5py
 import numpy as np
 import xarray as xr
@@ -17,7 +15,7 @@ import xarray as xr
 from mt_metadata.transfer_functions.tf import StatisticalEstimate
 
 from mth5.utils.exceptions import MTH5Error
-from mth5.helpers import to_numpy_type
+from mth5.helpers import to_numpy_type, set_attribute, metadata_items
 from mth5.utils.mth5_logger import setup_logger
 
 # =============================================================================
@@ -48,9 +46,7 @@ class EstimateDataset:
     def __init__(self, dataset, dataset_metadata=None, write_metadata=True, **kwargs):
 
         if dataset is not None and isinstance(dataset, (h5py.Dataset)):
-            self.hdf5_dataset = weakref.ref(dataset)()
-
-        self.logger = setup_logger(f"{__name__}.{self._class_name}")
+            self.hdf5_dataset = dataset
 
         # set metadata to the appropriate class.  Standards is not a
         # Base object so should be skipped. If the class name is not
@@ -132,9 +128,15 @@ class EstimateDataset:
     def __repr__(self):
         return self.__str__()
 
-    @property
-    def _class_name(self):
-        return self.__class__.__name__.split("Dataset")[0]
+    # the class name and logger do not change, so set them once for each
+    # subclass
+    _class_name = "Estimate"
+    logger = setup_logger(f"{__name__}.Estimate")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._class_name = cls.__name__.split("Dataset")[0]
+        cls.logger = setup_logger(f"{__name__}.{cls._class_name}")
 
     def read_metadata(self):
         """
@@ -151,10 +153,9 @@ class EstimateDataset:
         dictionary.
 
         """
-        meta_dict = self.metadata.to_dict()[self.metadata._class_name.lower()]
-        for key, value in meta_dict.items():
-            value = to_numpy_type(value)
-            self.hdf5_dataset.attrs.create(key, value)
+        attrs = self.hdf5_dataset.attrs
+        for key, value in metadata_items(self.metadata):
+            set_attribute(attrs, key, to_numpy_type(value))
 
     def replace_dataset(self, new_data_array):
         """
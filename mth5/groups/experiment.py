@@ -97,4 +97,4 @@ class ExperimentGroup(BaseGroup):
 
     @property
     def surveys_group(self):
-        return MasterSurveyGroup(self.hdf5_group["Surveys"])
+        return MasterSurveyGroup(self.hdf5_group["Surveys"], **self.dataset_options)
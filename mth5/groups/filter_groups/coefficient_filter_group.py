@@ -15,6 +15,7 @@ Created on Wed Jun  9 08:58:15 2021
 from mt_metadata.timeseries.filters import CoefficientFilter
 
 from mth5.groups.base import BaseGroup
+from mth5.helpers import create_metadata_group
 
 # =============================================================================
 #  COEFFCIENT Group
@@ -61,7 +62,7 @@ class CoefficientGroup(BaseGroup):
 
         """
         # create a group for the filter by the name
-        coefficient_filter_group = self.hdf5_group.create_group(name)
+        coefficient_filter_group = create_metadata_group(self.hdf5_group, name)
 
         # fill in the metadata
         coefficient_filter_group.attrs.update(coefficient_metadata)
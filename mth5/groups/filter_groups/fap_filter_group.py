@@ -17,6 +17,7 @@ import numpy as np
 from mt_metadata.timeseries.filters import FrequencyResponseTableFilter
 
 from mth5.groups.base import BaseGroup
+from mth5.helpers import create_metadata_group
 
 # =============================================================================
 # fap Group
@@ -62,7 +63,7 @@ class FAPGroup(BaseGroup):
 
         """
         # create a group for the filter by the name
-        fap_filter_group = self.hdf5_group.create_group(name)
+        fap_filter_group = create_metadata_group(self.hdf5_group, name)
 
         # create datasets for the poles and zeros
         fap_ds = fap_filter_group.create_dataset(
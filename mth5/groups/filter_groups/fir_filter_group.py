@@ -17,6 +17,7 @@ Created on Wed Jun  9 08:55:16 2021
 from mt_metadata.timeseries.filters import FIRFilter
 
 from mth5.groups.base import BaseGroup
+from mth5.helpers import create_metadata_group
 
 # =============================================================================
 # fir Group
@@ -62,7 +63,7 @@ class FIRGroup(BaseGroup):
 
         """
         # create a group for the filter by the name
-        fir_filter_group = self.hdf5_group.create_group(name)
+        fir_filter_group = create_metadata_group(self.hdf5_group, name)
 
         # create datasets for the poles and zeros
         fir_ds = fir_filter_group.create_dataset(
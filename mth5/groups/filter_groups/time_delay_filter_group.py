@@ -15,6 +15,7 @@ Created on Wed Jun  9 09:01:55 2021
 from mt_metadata.timeseries.filters import TimeDelayFilter
 
 from mth5.groups.base import BaseGroup
+from mth5.helpers import create_metadata_group
 
 # =============================================================================
 # TimeDelay Group
@@ -65,7 +66,7 @@ class TimeDelayGroup(BaseGroup):
 
         """
         # create a group for the filter by the name
-        time_delay_filter_group = self.hdf5_group.create_group(name)
+        time_delay_filter_group = create_metadata_group(self.hdf5_group, name)
 
         # fill in the metadata
         time_delay_filter_group.attrs.update(time_delay_metadata)
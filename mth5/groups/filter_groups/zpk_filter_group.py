@@ -15,6 +15,7 @@ Created on Wed Jun  9 08:55:16 2021
 from mt_metadata.timeseries.filters import PoleZeroFilter
 
 from mth5.groups.base import BaseGroup
+from mth5.helpers import create_metadata_group
 
 # =============================================================================
 # ZPK Group
@@ -60,7 +61,7 @@ class ZPKGroup(BaseGroup):
 
         """
         # create a group for the filter by the name
-        zpk_filter_group = self.hdf5_group.create_group(name)
+        zpk_filter_group = create_metadata_group(self.hdf5_group, name)
 
         # create datasets for the poles and zeros
         poles_ds = zpk_filter_group.create_dataset(
@@ -24,6 +24,7 @@ from mth5.groups.filter_groups import (
     FAPGroup,
     FIRGroup,
 )
+from mth5.helpers import create_metadata_group
 
 # =============================================================================
 # Filters Group
@@ -40,31 +41,31 @@ class FiltersGroup(BaseGroup):
         super().__init__(group, **kwargs)
 
         try:
-            self.zpk_group = ZPKGroup(self.hdf5_group.create_group("zpk"))
+            self.zpk_group = ZPKGroup(create_metadata_group(self.hdf5_group, "zpk"))
         except ValueError:
             self.zpk_group = ZPKGroup(self.hdf5_group["zpk"])
 
         try:
             self.coefficient_group = CoefficientGroup(
-                self.hdf5_group.create_group("coefficient")
+                create_metadata_group(self.hdf5_group, "coefficient")
             )
         except ValueError:
             self.coefficient_group = CoefficientGroup(self.hdf5_group["coefficient"])
 
         try:
             self.time_delay_group = TimeDelayGroup(
-                self.hdf5_group.create_group("time_delay")
+                create_metadata_group(self.hdf5_group, "time_delay")
             )
         except ValueError:
             self.time_delay_group = TimeDelayGroup(self.hdf5_group["time_delay"])
 
         try:
-            self.fap_group = FAPGroup(self.hdf5_group.create_group("fap"))
+            self.fap_group = FAPGroup(create_metadata_group(self.hdf5_group, "fap"))
         except ValueError:
             self.fap_group = FAPGroup(self.hdf5_group["fap"])
 
         try:
-            self.fir_group = FIRGroup(self.hdf5_group.create_group("fir"))
+            self.fir_group = FIRGroup(create_metadata_group(self.hdf5_group, "fir"))
         except ValueError:
             self.fir_group = FIRGroup(self.hdf5_group["fir"])
 
@@ -15,8 +15,6 @@ get a circular import.
 # =============================================================================
 # Imports
 # =============================================================================
-import inspect
-import weakref
 
 import h5py
 import numpy as np
@@ -33,17 +31,23 @@ from mth5.groups.base import BaseGroup
 from mth5.groups import FiltersGroup, TransferFunctionGroup
 from mth5.utils.exceptions import MTH5Error
 from mth5.helpers import (
+    create_metadata_group,
     to_numpy_type,
+    compute_default_chunks,
     from_numpy_type,
     inherit_doc_string,
     validate_name,
+    write_direct_chunks,
+    get_module_classes,
+    set_attribute,
+    metadata_items,
 )
 
 from mth5.timeseries import ChannelTS, RunTS
-from mth5.timeseries.channel_ts import make_dt_coordinates
+from mth5.timeseries.channel_ts import make_dt_coordinates, get_channel_type
 from mth5.utils.mth5_logger import setup_logger
 
-meta_classes = dict(inspect.getmembers(metadata, inspect.isclass))
+meta_classes = get_module_classes(metadata)
 # =============================================================================
 # Standards Group
 # =============================================================================
@@ -275,7 +279,7 @@ class MasterStationGroup(BaseGroup):
 
         station_name = validate_name(station_name)
         try:
-            station_group = self.hdf5_group.create_group(station_name)
+            station_group = create_metadata_group(self.hdf5_group, station_name)
             self.logger.debug("Created group %s", station_group.name)
 
             if station_metadata is None:
@@ -288,9 +292,11 @@ class MasterStationGroup(BaseGroup):
                     )
                     self.logger.error(msg)
                     raise MTH5Error(msg)
+            # metadata are written once by initialize_group
             station_obj = StationGroup(
                 station_group,
                 station_metadata=station_metadata,
+                write_metadata=False,
                 **self.dataset_options,
             )
             station_obj.initialize_group()
@@ -564,14 +570,14 @@ class StationGroup(BaseGroup):
         self.write_metadata()
 
         for group_name in self._default_subgroup_names:
-            self.hdf5_group.create_group(f"{group_name}")
+            create_metadata_group(self.hdf5_group, f"{group_name}")
             m5_grp = getattr(self, f"{group_name.lower()}_group")
             m5_grp.initialize_group()
 
     @property
     def master_station_group(self):
         """shortcut to master station group"""
-        return MasterStationGroup(self.hdf5_group.parent)
+        return MasterStationGroup(self.hdf5_group.parent, **self.dataset_options)
 
     @property
     def transfer_functions_group(self):
@@ -730,15 +736,19 @@ class StationGroup(BaseGroup):
 
         run_name = validate_name(run_name)
         try:
-            run_group = self.hdf5_group.create_group(run_name)
+            run_group = create_metadata_group(self.hdf5_group, run_name)
             if run_metadata is None:
                 run_metadata = metadata.Run(id=run_name)
             elif validate_name(run_metadata.id) != run_name:
                 msg = "Run name %s must be the same as run_metadata.id %s"
                 self.logger.error(msg, run_name, run_metadata.id)
                 raise MTH5Error(msg % (run_name, run_metadata.id))
+            # metadata are written once by initialize_group
             run_obj = RunGroup(
-                run_group, run_metadata=run_metadata, **self.dataset_options
+                run_group,
+                run_metadata=run_metadata,
+                write_metadata=False,
+                **self.dataset_options,
             )
             run_obj.initialize_group()
         except ValueError:
@@ -899,7 +909,7 @@ class TransferFunctionsGroup(BaseGroup):
         name = validate_name(name)
 
         tf_group = TransferFunctionGroup(
-            self.hdf5_group.create_group(name), **self.dataset_options
+            create_metadata_group(self.hdf5_group, name), **self.dataset_options
         )
 
         if tf_object is not None:
@@ -1175,12 +1185,14 @@ class RunGroup(BaseGroup):
     @property
     def station_group(self):
         """shortcut to station group"""
-        return StationGroup(self.hdf5_group.parent)
+        return StationGroup(self.hdf5_group.parent, **self.dataset_options)
 
     @property
     def master_station_group(self):
         """shortcut to master station group"""
-        return MasterStationGroup(self.hdf5_group.parent.parent)
+        return MasterStationGroup(
+            self.hdf5_group.parent.parent, **self.dataset_options
+        )
 
     @BaseGroup.metadata.getter
     def metadata(self):
@@ -1262,9 +1274,9 @@ class RunGroup(BaseGroup):
 
         """
 
-        for key, value in self.metadata.to_dict(single=True).items():
-            value = to_numpy_type(value)
-            self.hdf5_group.attrs.create(key, value)
+        attrs = self.hdf5_group.attrs
+        for key, value in metadata_items(self.metadata):
+            set_attribute(attrs, key, to_numpy_type(value))
 
     def add_channel(
         self,
@@ -1275,6 +1287,7 @@ class RunGroup(BaseGroup):
         max_shape=(None,),
         chunks=True,
         channel_metadata=None,
+        direct=False,
         **kwargs,
     ):
         """
@@ -1290,6 +1303,11 @@ class RunGroup(BaseGroup):
         :type channel_metadata: [ :class:`mth5.metadata.Electric` |
                                  :class:`mth5.metadata.Magnetic` |
                                  :class:`mth5.metadata.Auxiliary` ], optional
+        :param direct: compress chunks in parallel and write them with direct
+         chunk writes, used with the default dataset options and any mix of
+         gzip, shuffle and fletcher32, for other filters data are written
+         through the HDF5 filter pipeline, defaults to False
+        :type direct: boolean, optional
         :return: Channel container
         :rtype: [ :class:`mth5.mth5_groups.ElectricDatset` |
                  :class:`mth5.mth5_groups.MagneticDatset` |
@@ -1315,8 +1333,27 @@ class RunGroup(BaseGroup):
         if data is not None:
             if data.size < 1024:
                 chunks = None
+            elif chunks is True:
+                chunks = compute_default_chunks(data.shape, data.dtype)
         try:
-            if data is not None:
+            if data is not None and direct and isinstance(chunks, tuple):
+                channel_group = self.hdf5_group.create_dataset(
+                    channel_name,
+                    shape=data.shape,
+                    dtype=data.dtype,
+                    chunks=chunks,
+                    maxshape=max_shape,
+                    **self.dataset_options,
+                )
+                if not write_direct_chunks(channel_group, data):
+                    self.logger.warning(
+                        f"Cannot write {channel_name} with direct chunk writes "
+                        f"for dataset options {self.dataset_options}, only "
+                        "gzip, shuffle and fletcher32 are supported. Writing "
+                        "through the HDF5 filter pipeline."
+                    )
+                    channel_group[...] = data
+            elif data is not None:
                 channel_group = self.hdf5_group.create_dataset(
                     channel_name,
                     data=data,
@@ -1348,6 +1385,10 @@ class RunGroup(BaseGroup):
                                     * channel_metadata.sample_rate
                                 ),
                             )
+                            if chunks is True:
+                                chunks = compute_default_chunks(
+                                    estimate_size, channel_dtype
+                                )
                     else:
                         estimate_size = (1,)
                         chunks = CHUNK_SIZE
@@ -1549,7 +1590,9 @@ class RunGroup(BaseGroup):
         :parameter :class:`mth5.timeseries.RunTS` run_ts_obj: Run object with all
         the appropriate channels and metadata.
 
-        Will create a run group and appropriate channel datasets.
+        Will create a run group and appropriate channel datasets.  Keyword
+        arguments are passed to :meth:`add_channel`, use `direct=True` to
+        compress the chunks of each channel in parallel.
         """
 
         if not isinstance(run_ts_obj, RunTS):
@@ -1650,16 +1693,12 @@ class RunGroup(BaseGroup):
 
         """
         channel_summary = self.channel_summary.copy()
-        channels_recorded = channel_summary.component.to_list()
-        self.metadata.channels_recorded_electric = [
-            cc for cc in channels_recorded if cc[0] in ["e"]
-        ]
-        self.metadata.channels_recorded_magnetic = [
-            cc for cc in channels_recorded if cc[0] in ["h", "b"]
-        ]
-        self.metadata.channels_recorded_auxiliary = [
-            cc for cc in channels_recorded if cc[0] not in ["e", "h", "b"]
-        ]
+        channels_recorded = {"electric": [], "magnetic": [], "auxiliary": []}
+        for cc in channel_summary.component.to_list():
+            channels_recorded[get_channel_type(cc)].append(cc)
+        self.metadata.channels_recorded_electric = channels_recorded["electric"]
+        self.metadata.channels_recorded_magnetic = channels_recorded["magnetic"]
+        self.metadata.channels_recorded_auxiliary = channels_recorded["auxiliary"]
 
         self.metadata.time_period.start = channel_summary.start.min().isoformat()
         self.metadata.time_period.end = channel_summary.end.max().isoformat()
@@ -1723,9 +1762,7 @@ class ChannelDataset:
         for key, value in kwargs.items():
             setattr(self, key, value)
         if dataset is not None and isinstance(dataset, (h5py.Dataset)):
-            self.hdf5_dataset = weakref.ref(dataset)()
-        self.logger = setup_logger(f"{__name__}.{self._class_name}")
-
+            self.hdf5_dataset = dataset
         # set metadata to the appropriate class.  Standards is not a
         # Base object so should be skipped. If the class name is not
         # defined yet set to Base class.
@@ -1818,9 +1855,15 @@ class ChannelDataset:
     def __repr__(self):
         return self.__str__()
 
-    @property
-    def _class_name(self):
-        return self.__class__.__name__.split("Dataset")[0]
+    # the class name and logger do not change, so set them once for each
+    # subclass
+    _class_name = "Channel"
+    logger = setup_logger(f"{__name__}.Channel")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._class_name = cls.__name__.split("Dataset")[0]
+        cls.logger = setup_logger(f"{__name__}.{cls._class_name}")
 
     @property
     def run_group(self):
@@ -1901,8 +1944,44 @@ class ChannelDataset:
         """
 
         return make_dt_coordinates(
-            self.start, self.sample_rate, self.n_samples, self._logger
+            self.start, self.sample_rate, self.n_samples, self.logger
+        )
+
+    def _time_in_index(self, given_time):
+        """
+        Check if a time falls on a sample of :attr:`time_index` without
+        building the index.  The time is matched to the resolution of its
+        time string like a partial string match in pandas, a sample has to
+        fall within [time, time + 1 s) or [time, time + 1 us).
+
+        :param given_time: time to look for
+        :type given_time: string or :class:`mth5.utils.MTime`
+        :return: True if a sample falls on the given time
+        :rtype: bool
+
+        """
+        if not isinstance(given_time, MTime):
+            given_time = MTime(given_time)
+        if self.n_samples < 1:
+            return False
+        sample_rate = self.sample_rate
+        if sample_rate in [0, None]:
+            sample_rate = 1
+        dt_step = int(round(1.0e9 / sample_rate))
+        dt_start = int(
+            np.datetime64(self.start.iso_str.split("+", 1)[0], "ns").astype(np.int64)
         )
+        dt_time = int(np.datetime64(given_time.iso_no_tz, "ns").astype(np.int64))
+        if given_time.dt_object.microsecond == 0:
+            resolution = 1000000000
+        else:
+            resolution = 1000
+
+        # first sample at or after the given time
+        index = max(-((dt_start - dt_time) // dt_step), 0)
+        if index >= self.n_samples:
+            return False
+        return dt_start + index * dt_step - dt_time < resolution
 
     def read_metadata(self):
         """
@@ -1919,10 +1998,9 @@ class ChannelDataset:
         dictionary.
 
         """
-        meta_dict = self.metadata.to_dict()[self.metadata._class_name.lower()]
-        for key, value in meta_dict.items():
-            value = to_numpy_type(value)
-            self.hdf5_dataset.attrs.create(key, value)
+        attrs = self.hdf5_dataset.attrs
+        for key, value in metadata_items(self.metadata):
+            set_attribute(attrs, key, to_numpy_type(value))
 
     def replace_dataset(self, new_data_array):
         """
@@ -2058,7 +2136,7 @@ class ChannelDataset:
             self.logger.info(
                 f"new start time {start_time} is before existing {self.start}"
             )
-            if end_time.iso_no_tz not in self.time_index:
+            if not self._time_in_index(end_time):
                 gap = abs(end_time - self.start)
                 if gap > 0:
                     if gap > max_gap_seconds:
@@ -2161,7 +2239,7 @@ class ChannelDataset:
         # append data
         elif start_t_diff > 0:
             old_end = self.end.copy()
-            if start_time.iso_no_tz not in self.time_index:
+            if not self._time_in_index(start_time):
                 gap = abs(self.end - start_time)
                 if gap > 0:
                     if gap > max_gap_seconds:
@@ -2275,6 +2353,7 @@ class ChannelDataset:
             run_metadata=self.run_group.metadata,
             station_metadata=self.station_group.metadata,
             channel_response_filter=self.channel_response_filter,
+            _trusted=True,
         )
 
     def to_xarray(self):
@@ -2441,10 +2520,11 @@ class ChannelDataset:
             self.replace_dataset(data_array.values)
             self.write_metadata()
         elif how == "extend":
+            time_index = data_array.coords.indexes["time"]
             self.extend_dataset(
                 data_array.values,
-                data_array.coords.indexes["time"][0].isoformat(),
-                1e9 / data_array.coords.indexes["time"][0].freq.nanos,
+                time_index[0].isoformat(),
+                1e9 / np.median(np.diff(time_index.asi8)),
                 fill=fill,
             )
         # TODO need to check on metadata.
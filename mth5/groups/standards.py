@@ -12,10 +12,10 @@ Created on Wed Dec 23 17:05:33 2020
 # =============================================================================
 # Imports
 # =============================================================================
-import inspect
 import numpy as np
 
 from mth5.groups.base import BaseGroup
+from mth5.helpers import get_module_classes
 from mth5.tables import MTH5Table
 from mth5.utils.exceptions import MTH5TableError
 
@@ -24,8 +24,8 @@ from mt_metadata import timeseries
 from mt_metadata.timeseries import filters
 from mt_metadata.utils.validators import validate_attribute
 
-ts_classes = dict(inspect.getmembers(timeseries, inspect.isclass))
-flt_classes = dict(inspect.getmembers(filters, inspect.isclass))
+ts_classes = get_module_classes(timeseries)
+flt_classes = get_module_classes(filters)
 # =============================================================================
 # Summarize standards
 # =============================================================================
@@ -25,7 +25,7 @@ from mth5.groups import (
     StandardsGroup,
 )
 from mth5.utils.exceptions import MTH5Error
-from mth5.helpers import validate_name
+from mth5.helpers import validate_name, create_metadata_group
 from mth5.tables import MTH5Table
 
 from mt_metadata.timeseries import Survey
@@ -260,7 +260,7 @@ class MasterSurveyGroup(BaseGroup):
 
         survey_name = validate_name(survey_name)
         try:
-            survey_group = self.hdf5_group.create_group(survey_name)
+            survey_group = create_metadata_group(self.hdf5_group, survey_name)
             self.logger.debug("Created group %s", survey_group.name)
 
             if survey_metadata is None:
@@ -275,8 +275,12 @@ class MasterSurveyGroup(BaseGroup):
                     self.logger.error(msg)
                     raise MTH5Error(msg)
 
+            # metadata are written once by initialize_group
             survey_obj = SurveyGroup(
-                survey_group, survey_metadata=survey_metadata, **self.dataset_options,
+                survey_group,
+                survey_metadata=survey_metadata,
+                write_metadata=False,
+                **self.dataset_options,
             )
             survey_obj.initialize_group()
 
@@ -448,13 +452,13 @@ class SurveyGroup(BaseGroup):
         self.write_metadata()
 
         for group_name in self._default_subgroup_names:
-            self.hdf5_group.create_group(f"{group_name}")
+            create_metadata_group(self.hdf5_group, f"{group_name}")
             m5_grp = getattr(self, f"{group_name.lower()}_group")
             m5_grp.initialize_group()
 
     @property
     def stations_group(self):
-        return MasterStationGroup(self.hdf5_group["Stations"])
+        return MasterStationGroup(self.hdf5_group["Stations"], **self.dataset_options)
 
     @property
     def filters_group(self):
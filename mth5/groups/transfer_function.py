@@ -256,21 +256,23 @@ class TransferFunctionGroup(BaseGroup):
         tf_obj = TF()
 
         # get survey metadata
-        survey_dict = dict(self.hdf5_group.parent.parent.parent.parent.attrs)
-        for key, value in survey_dict.items():
-            survey_dict[key] = from_numpy_type(value)
+        survey_dict = {
+            key: from_numpy_type(value)
+            for key, value in self.hdf5_group.parent.parent.parent.parent.attrs.items()
+        }
         tf_obj.survey_metadata.from_dict({"survey": survey_dict})
 
         # get station metadata
-        station_dict = dict(self.hdf5_group.parent.parent.attrs)
-        for key, value in station_dict.items():
-            station_dict[key] = from_numpy_type(value)
+        station_dict = {
+            key: from_numpy_type(value)
+            for key, value in self.hdf5_group.parent.parent.attrs.items()
+        }
         tf_obj.station_metadata.from_dict({"station": station_dict})
 
         # need to update transfer function metadata
-        tf_dict = dict(self.hdf5_group.attrs)
-        for key, value in tf_dict.items():
-            tf_dict[key] = from_numpy_type(value)
+        tf_dict = {
+            key: from_numpy_type(value) for key, value in self.hdf5_group.attrs.items()
+        }
         tf_obj.station_metadata.transfer_function.from_dict(
             {"transfer_function": tf_dict}
         )
@@ -280,16 +282,16 @@ class TransferFunctionGroup(BaseGroup):
         for run_id in tf_obj.station_metadata.transfer_function.runs_processed:
             try:
                 run = self.hdf5_group.parent.parent[validate_name(run_id)]
-                run_dict = dict(run.attrs)
-                for key, value in run_dict.items():
-                    run_dict[key] = from_numpy_type(value)
+                run_dict = {
+                    key: from_numpy_type(value) for key, value in run.attrs.items()
+                }
                 run_obj = Run(**run_dict)
 
                 for ch_id in run.keys():
                     ch = run[validate_name(ch_id)]
-                    ch_dict = dict(ch.attrs)
-                    for key, value in ch_dict.items():
-                        ch_dict[key] = from_numpy_type(value)
+                    ch_dict = {
+                        key: from_numpy_type(value) for key, value in ch.attrs.items()
+                    }
                     if ch_dict["type"] == "electric":
                         ch_obj = Electric(**ch_dict)
                     elif ch_dict["type"] == "magnetic":
@@ -14,12 +14,22 @@ Created on Tue Jun  2 12:37:50 2020
 # =============================================================================
 # Imports
 # =============================================================================
+from collections import deque
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import copy
 import inspect
+import os
+import struct
+import zlib
 import numpy as np
 import h5py
 import gc
 
+from mt_metadata.base import Base
+from mt_metadata.base.helpers import flatten_dict
+
 from mth5.utils.mth5_logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -91,6 +101,344 @@ def validate_compression(compression, level):
     return compression, level
 
 
+# =============================================================================
+# Chunking
+# =============================================================================
+# target size of a single chunk in bytes, matches the default HDF5 chunk cache
+CHUNK_NBYTES = 1024 ** 2
+# smallest number of samples in a chunk along the time axis
+MIN_CHUNK_SIZE = 1024
+
+
+def compute_default_chunks(shape, dtype, target_nbytes=CHUNK_NBYTES):
+    """
+    Compute a chunk shape for a dataset that is read along the first axis,
+    like a time series.  h5py's auto-chunking aims for small chunks, which
+    for long 1-D time series means many chunks per read.  Instead aim for
+    chunks of about `target_nbytes`.
+
+    For 1-D arrays the chunk is `target_nbytes // itemsize` samples, for 2-D
+    arrays full rows are kept together and the number of rows is set so the
+    chunk is about `target_nbytes`.  The chunk is capped at the shape of the
+    array.
+
+    :param shape: shape of the dataset
+    :type shape: tuple
+    :param dtype: data type of the dataset
+    :type dtype: np.dtype or string
+    :param target_nbytes: target size of a chunk in bytes,
+     defaults to CHUNK_NBYTES
+    :type target_nbytes: integer, optional
+    :return: chunk shape or True to let h5py guess if the dataset is more than
+     2 dimensions
+    :rtype: tuple or boolean
+
+    >>> compute_default_chunks((4096000,), "int32")
+    (262144,)
+
+    """
+    itemsize = max(np.dtype(dtype).itemsize, 1)
+    shape = tuple(shape)
+    if len(shape) == 1:
+        n_chunk = max(MIN_CHUNK_SIZE, target_nbytes // itemsize)
+        return (max(1, min(shape[0], n_chunk)),)
+    elif len(shape) == 2:
+        n_cols = max(shape[1], 1)
+        n_rows = max(1, target_nbytes // (n_cols * itemsize))
+        return (max(1, min(shape[0], n_rows)), n_cols)
+    return True
+
+
+# filters that can be applied and undone without the HDF5 filter pipeline
+DIRECT_FILTERS = (
+    h5py.h5z.FILTER_SHUFFLE,
+    h5py.h5z.FILTER_DEFLATE,
+    h5py.h5z.FILTER_FLETCHER32,
+)
+
+
+def _get_direct_filters(dataset):
+    """
+    Get the filter pipeline of a dataset in the order the filters are
+    applied, as a list of (filter code, filter options).  None if a filter is
+    not in `DIRECT_FILTERS`.
+    """
+    dcpl = dataset.id.get_create_plist()
+    filters = []
+    for ii in range(dcpl.get_nfilters()):
+        code, flags, options, name = dcpl.get_filter(ii)
+        if code not in DIRECT_FILTERS:
+            return None
+        filters.append((code, options))
+    return filters
+
+
+def fletcher32(data):
+    """
+    Fletcher32 checksum of a buffer, the same as `H5_checksum_fletcher32`
+    in HDF5.  The bytes are summed as big endian 16 bit words in blocks of
+    360 words, the sums of each block are computed with numpy.
+
+    :param data: bytes to check
+    :type data: bytes-like
+    :return: checksum
+    :rtype: integer
+
+    """
+    data = np.frombuffer(data, dtype=np.uint8)
+    n_words = data.size // 2
+    words = (data[0 : 2 * n_words : 2].astype(np.int64) << 8) | data[
+        1 : 2 * n_words : 2
+    ]
+    n_full = n_words // 360
+    blocks = words[: n_full * 360].reshape(n_full, 360)
+    lengths = [360] * n_full
+    sums = blocks.sum(axis=1).tolist()
+    # each word is added to the second sum once for every word after it
+    weighted = (blocks @ np.arange(360, 0, -1, dtype=np.int64)).tolist()
+    rest = words[n_full * 360 :]
+    if rest.size:
+        lengths.append(rest.size)
+        sums.append(int(rest.sum()))
+        weighted.append(int(rest @ np.arange(rest.size, 0, -1, dtype=np.int64)))
+
+    sum1 = sum2 = 0
+    for n_block, block_sum, block_weighted in zip(lengths, sums, weighted):
+        # HDF5 uses uint32 sums, the second one can wrap around
+        sum2 = (sum2 + n_block * sum1 + block_weighted) & 0xFFFFFFFF
+        sum1 = sum1 + block_sum
+        sum1 = (sum1 & 0xFFFF) + (sum1 >> 16)
+        sum2 = (sum2 & 0xFFFF) + (sum2 >> 16)
+    if data.size % 2:
+        sum1 += int(data[-1]) << 8
+        sum2 += sum1
+        sum1 = (sum1 & 0xFFFF) + (sum1 >> 16)
+        sum2 = (sum2 & 0xFFFF) + (sum2 >> 16)
+    sum1 = (sum1 & 0xFFFF) + (sum1 >> 16)
+    sum2 = (sum2 & 0xFFFF) + (sum2 >> 16)
+    return (sum2 << 16) | sum1
+
+
+def _shuffle(raw, itemsize):
+    """
+    Byte shuffle like the HDF5 shuffle filter, bytes after the last full
+    element are left in place.
+    """
+    data = np.frombuffer(raw, dtype=np.uint8)
+    n_items = data.size // itemsize
+    if itemsize <= 1 or n_items <= 1:
+        return raw
+    shuffled = np.empty_like(data)
+    n_bytes = n_items * itemsize
+    shuffled[:n_bytes].reshape(itemsize, n_items)[:] = (
+        data[:n_bytes].reshape(n_items, itemsize).T
+    )
+    shuffled[n_bytes:] = data[n_bytes:]
+    return shuffled
+
+
+def _unshuffle(raw, itemsize):
+    """
+    Undo the HDF5 byte shuffle one byte plane at a time, much faster than a
+    strided transpose copy.
+    """
+    data = np.frombuffer(raw, dtype=np.uint8)
+    n_items = data.size // itemsize
+    if itemsize <= 1 or n_items <= 1:
+        return raw
+    n_bytes = n_items * itemsize
+    planes = data[:n_bytes].reshape(itemsize, n_items)
+    unshuffled = np.empty_like(data)
+    items = unshuffled[:n_bytes].reshape(n_items, itemsize)
+    for ii in range(itemsize):
+        items[:, ii] = planes[ii]
+    unshuffled[n_bytes:] = data[n_bytes:]
+    return unshuffled
+
+
+def _encode_chunk(block, filters):
+    """
+    Apply the shuffle, deflate and fletcher32 filters to a chunk the same way
+    the HDF5 filter pipeline does.
+    """
+    raw = np.ascontiguousarray(block)
+    itemsize = raw.dtype.itemsize
+    raw = raw.view(np.uint8).ravel()
+    for code, options in filters:
+        if code == h5py.h5z.FILTER_SHUFFLE:
+            raw = _shuffle(raw, options[0] if options else itemsize)
+        elif code == h5py.h5z.FILTER_DEFLATE:
+            raw = zlib.compress(raw, options[0] if options else 4)
+        elif code == h5py.h5z.FILTER_FLETCHER32:
+            raw = b"".join([raw, struct.pack("<I", fletcher32(raw))])
+    return bytes(raw)
+
+
+def _decode_chunk(raw, filters, itemsize):
+    """
+    Undo the shuffle, deflate and fletcher32 filters of a chunk read from
+    disk.  None if the fletcher32 checksum does not match, so the caller can
+    let HDF5 report the error.
+    """
+    for code, options in reversed(filters):
+        if code == h5py.h5z.FILTER_FLETCHER32:
+            stored = struct.unpack("<I", raw[-4:])[0]
+            raw = raw[:-4]
+            checksum = fletcher32(raw)
+            # HDF5 before 1.6.3 stored the checksum with swapped bytes
+            swapped = ((checksum & 0x00FF00FF) << 8) | ((checksum >> 8) & 0x00FF00FF)
+            if stored not in (checksum, swapped):
+                return None
+        elif code == h5py.h5z.FILTER_DEFLATE:
+            raw = zlib.decompress(raw)
+        elif code == h5py.h5z.FILTER_SHUFFLE:
+            raw = _unshuffle(raw, options[0] if options else itemsize)
+    return raw
+
+
+def write_direct_chunks(dataset, data, n_threads=None):
+    """
+    Write a 1-D array into a chunked dataset with direct chunk writes,
+    bypassing the HDF5 filter pipeline.  Chunks are compressed with zlib in a
+    thread pool (zlib releases the GIL) and written in order.
+
+    Only the shuffle, gzip and fletcher32 filters can be reproduced, if the
+    dataset uses any other filter (lzf, szip, scaleoffset) nothing is written
+    and False is returned so the caller can write the data through the
+    normal pipeline.
+
+    :param dataset: chunked dataset with the same shape as data
+    :type dataset: :class:`h5py.Dataset`
+    :param data: data to write
+    :type data: np.ndarray
+    :param n_threads: number of threads used to compress chunks,
+     defaults to None
+    :type n_threads: integer, optional
+    :return: True if the data were written
+    :rtype: boolean
+
+    """
+    if dataset.chunks is None or dataset.ndim != 1 or dataset.shape != data.shape:
+        return False
+    filters = _get_direct_filters(dataset)
+    if filters is None:
+        return False
+    n_chunk = dataset.chunks[0]
+    data = np.asarray(data, dtype=dataset.dtype)
+
+    def get_block(start):
+        block = data[start : start + n_chunk]
+        # edge chunks are always stored full size
+        if block.size < n_chunk:
+            block = np.concatenate(
+                [block, np.zeros(n_chunk - block.size, dtype=block.dtype)]
+            )
+        return _encode_chunk(block, filters)
+
+    offsets = range(0, data.size, n_chunk)
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        for start, payload in zip(offsets, executor.map(get_block, offsets)):
+            dataset.id.write_direct_chunk((start,), payload, filter_mask=0)
+    return True
+
+
+def _can_read_direct(dataset):
+    """
+    Check if the chunks of a dataset can be read and decoded without the
+    HDF5 filter pipeline.
+    """
+    return (
+        hasattr(os, "pread")
+        and dataset.file.driver == "sec2"
+        and dataset.chunks is not None
+        and dataset.ndim == 1
+        and dataset.dtype.isnative
+        and dataset.dtype.kind in "biufc"
+        and _get_direct_filters(dataset) is not None
+    )
+
+
+def iter_chunks(dataset, prefetch=8):
+    """
+    Iterate over a 1-D chunked dataset one chunk at a time, reading ahead.
+
+    The next `prefetch` chunks are read with `os.pread` from the byte offsets
+    HDF5 reports for each chunk and decompressed / unshuffled in a thread
+    pool, so disk reads and decompression overlap with the caller working on
+    the current chunk.  zlib and pread release the GIL.
+
+    Only the shuffle, gzip and fletcher32 filters are decoded here, a chunk
+    with a bad checksum is read through h5py, which raises the error.  Other
+    filters, drivers or platforms without `os.pread` fall back to reading
+    each chunk through h5py.
+
+    :param dataset: chunked 1-D dataset
+    :type dataset: :class:`h5py.Dataset`
+    :param prefetch: number of chunks to read ahead, defaults to 8
+    :type prefetch: integer, optional
+    :return: slice of the dataset and the data in that slice
+    :rtype: generator of (slice, np.ndarray)
+
+    >>> for index, data in iter_chunks(channel.hdf5_dataset):
+    ...     total += data.sum()
+
+    """
+    n_samples = dataset.shape[0]
+    if dataset.chunks is None:
+        if n_samples:
+            yield slice(0, n_samples), dataset[()]
+        return
+    n_chunk = dataset.chunks[0]
+    starts = range(0, n_samples, n_chunk)
+
+    if not _can_read_direct(dataset):
+        for start in starts:
+            index = slice(start, min(start + n_chunk, n_samples))
+            yield index, dataset[index]
+        return
+
+    # make sure what is on disk matches the dataset
+    dataset.file.flush()
+    dtype = dataset.dtype
+    filters = _get_direct_filters(dataset)
+    chunk_info = {}
+    for ii in range(dataset.id.get_num_chunks()):
+        info = dataset.id.get_chunk_info(ii)
+        chunk_info[info.chunk_offset[0]] = info
+
+    fid = os.open(dataset.file.filename, os.O_RDONLY)
+
+    def read_chunk(start):
+        index = slice(start, min(start + n_chunk, n_samples))
+        info = chunk_info.get(start)
+        if info is None:
+            return index, np.full(index.stop - start, dataset.fillvalue, dtype)
+        # a filter was skipped for this chunk, let HDF5 decode it
+        if info.filter_mask:
+            return index, dataset[index]
+        raw = _decode_chunk(
+            os.pread(fid, info.size, info.byte_offset), filters, dtype.itemsize
+        )
+        if raw is None:
+            return index, dataset[index]
+        data = np.frombuffer(raw, dtype=np.uint8)
+        if not data.flags.writeable:
+            data = data.copy()
+        return index, data.view(dtype)[: index.stop - start]
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(prefetch, 1)) as executor:
+            pending = deque()
+            for start in starts:
+                pending.append(executor.submit(read_chunk, start))
+                if len(pending) > prefetch:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    finally:
+        os.close(fid)
+
+
 def recursive_hdf5_tree(group, lines=[]):
     if isinstance(group, (h5py._hl.group.Group, h5py._hl.files.File)):
         for key, value in group.items():
@@ -194,6 +542,78 @@ def to_numpy_type(value):
         raise TypeError("Type {0} not understood".format(type(value)))
 
 
+def create_metadata_group(parent, name):
+    """
+    Create a group that holds metadata in its attributes.
+
+    Attributes are stored densely from the start (indexed by name and
+    creation order) instead of in the compact object header, which HDF5
+    converts to dense storage once a group has more than 8 attributes.
+    Metadata groups have tens of attributes so skip that migration.  Costs
+    a few kB per group in the file.
+
+    :param parent: parent group or file
+    :type parent: :class:`h5py.Group`
+    :param name: name of the new group, can be a path
+    :type name: string
+    :return: new group
+    :rtype: :class:`h5py.Group`
+    :raises ValueError: if the group already exists, same as
+     `h5py.Group.create_group`
+
+    """
+    gcpl = h5py.h5p.create(h5py.h5p.GROUP_CREATE)
+    gcpl.set_attr_phase_change(0, 0)
+    gcpl.set_attr_creation_order(
+        h5py.h5p.CRT_ORDER_TRACKED | h5py.h5p.CRT_ORDER_INDEXED
+    )
+    lcpl = h5py.h5p.create(h5py.h5p.LINK_CREATE)
+    lcpl.set_create_intermediate_group(True)
+    lcpl.set_char_encoding(h5py.h5t.CSET_UTF8)
+    group_id = h5py.h5g.create(
+        parent.id, name.encode("utf-8"), lcpl=lcpl, gcpl=gcpl
+    )
+    return h5py.Group(group_id)
+
+
+def set_attribute(attrs, key, value):
+    """
+    Write an attribute, overwriting an existing attribute in place when it has
+    the same type and shape.  `attrs.create` always deletes and recreates the
+    attribute, which gets slow for groups with many attributes that are
+    rewritten often.
+
+    Numeric values are only written in place if the data type matches
+    exactly, so nothing is cast, and strings only if the existing attribute
+    is a variable length string.  Otherwise the attribute is recreated.
+
+    :param attrs: attributes of an HDF5 group or dataset
+    :type attrs: :class:`h5py.AttributeManager`
+    :param key: attribute name
+    :type key: string
+    :param value: value converted with `to_numpy_type`
+    :type value: numpy compatible type
+
+    """
+    if key in attrs:
+        attr_id = attrs.get_id(key)
+        if isinstance(value, (str, np.str_)):
+            string_info = h5py.check_string_dtype(attr_id.dtype)
+            if (
+                attr_id.shape == ()
+                and string_info is not None
+                and string_info.length is None
+            ):
+                attrs.modify(key, value)
+                return
+        else:
+            array = np.asarray(value)
+            if array.dtype == attr_id.dtype and array.shape == attr_id.shape:
+                attr_id.write(np.ascontiguousarray(array))
+                return
+    attrs.create(key, value)
+
+
 def validate_name(name):
     """
     make sure the name has no spaces or slashes
@@ -208,6 +628,45 @@ def validate_name(name):
     return name.replace(" ", "_").replace("/", "_")
 
 
+def _bytes_array_to_list(value):
+    """convert an array of byte strings into a list of strings"""
+    return value.astype("U").tolist()
+
+
+def _array_to_list(value):
+    """convert an array into a list of python objects"""
+    return value.tolist()
+
+
+# converters for arrays read from HDF5 attributes keyed by numpy dtype.kind,
+# object arrays are left to the generic branches of from_numpy_type.
+NUMPY_KIND_CONVERTERS = {
+    "S": _bytes_array_to_list,
+    "U": _array_to_list,
+    "b": _array_to_list,
+    "i": _array_to_list,
+    "u": _array_to_list,
+    "f": _array_to_list,
+    "c": _array_to_list,
+}
+
+# types that are returned as is by from_numpy_type
+NUMPY_PASS_TYPES = frozenset(
+    [
+        str,
+        np.str_,
+        int,
+        float,
+        bool,
+        complex,
+        np.int_,
+        np.float_,
+        np.bool_,
+        np.complex_,
+    ]
+)
+
+
 def from_numpy_type(value):
     """
     Need to make the attributes friendly with Numpy and HDF5.
@@ -219,10 +678,21 @@ def from_numpy_type(value):
 
     HDF5 should only deal with ASCII characters or Unicode.  No binary data
     is allowed.
+
+    The common cases are resolved with a single lookup on the value type or
+    the array dtype kind before falling back to the generic checks.
     """
 
     if value is None:
         return "none"
+    value_type = type(value)
+    if value_type in NUMPY_PASS_TYPES:
+        return value
+    if value_type is np.ndarray:
+        try:
+            return NUMPY_KIND_CONVERTERS[value.dtype.kind](value)
+        except KeyError:
+            pass
     # For now turn references into a generic string
     if isinstance(value, h5py.h5r.Reference):
         value = str(value)
@@ -262,6 +732,217 @@ def inherit_doc_string(cls):
     return cls
 
 
+@lru_cache(maxsize=None)
+def get_module_classes(module):
+    """
+    Get the classes in a module as a dictionary {name: class}.
+
+    Built once per module from the module namespace, which avoids the
+    reflection pass of `inspect.getmembers` every time a module needs the
+    metadata classes.  Copy the dictionary before changing it, it is shared.
+
+    :param module: module to get classes from
+    :type module: module
+    :return: dictionary of classes keyed by name
+    :rtype: dictionary
+
+    >>> from mt_metadata import timeseries
+    >>> get_module_classes(timeseries)["Electric"]
+    <class 'mt_metadata.timeseries.electric.Electric'>
+
+    """
+    return {
+        name: obj for name, obj in vars(module).items() if inspect.isclass(obj)
+    }
+
+
+# sorted metadata keys for each metadata class,
+# {class: (attr_dict, n_attrs, keys)}.  mt_metadata shares the attribute
+# dictionary between instances of a class, so the same dictionary with the
+# same number of attributes means the keys have not changed.
+_SCHEMA_CACHE = {}
+_EMPTY_DATE = "1980-01-01T00:00:00+00:00"
+
+
+def _metadata_keys(metadata_object):
+    """
+    Sorted metadata keys, the same order as `metadata.to_dict`, cached per
+    metadata class.
+
+    :param metadata_object: metadata object
+    :type metadata_object: :class:`mt_metadata.base.Base`
+    :return: sorted attribute names of the metadata object
+    :rtype: list
+
+    """
+    attr_dict = metadata_object._attr_dict
+    entry = _SCHEMA_CACHE.get(type(metadata_object))
+    if entry is not None and entry[0] is attr_dict and entry[1] == len(attr_dict):
+        return entry[2]
+    keys = sorted(attr_dict.keys())
+    _SCHEMA_CACHE[type(metadata_object)] = (attr_dict, len(attr_dict), keys)
+    return keys
+
+
+def metadata_items(metadata_object):
+    """
+    Generator of (key, value) pairs of a metadata object, the same pairs as
+    `metadata.to_dict(single=True)` but without building and sorting a new
+    dictionary on every call.
+
+    :param metadata_object: metadata object
+    :type metadata_object: :class:`mt_metadata.base.Base`
+    :return: key, value pairs sorted by key
+    :rtype: generator
+
+    """
+    attr_dict = metadata_object._attr_dict
+    for key in _metadata_keys(metadata_object):
+        try:
+            value = metadata_object.get_attr_from_name(key)
+        except AttributeError:
+            value = None
+        if hasattr(value, "to_dict"):
+            value = value.to_dict()
+        elif isinstance(value, dict):
+            value = {
+                k: v.to_dict() if hasattr(v, "to_dict") else v
+                for k, v in value.items()
+            }
+        elif isinstance(value, list):
+            value = [v.to_dict() if hasattr(v, "to_dict") else v for v in value]
+        elif isinstance(value, np.ndarray):
+            if key in ["zeros", "poles"] or value.all() != 0:
+                yield key, value
+            continue
+        if value in [None, _EMPTY_DATE] and not attr_dict[key]["required"]:
+            continue
+        yield key, value
+
+
+# attributes of a metadata object that are not copied, the logger and attribute
+# dictionary belong to the object and class.
+_COPY_SKIP = ("logger", "_attr_dict", "_class_name")
+# immutable values that can be shared between metadata objects
+_COPY_AS_IS = (str, int, float, bool, type(None), h5py.Reference)
+
+
+def _copy_metadata_values(source, target):
+    """
+    Copy attribute values from source into target, recursing into nested
+    metadata objects.
+    """
+    target_dict = target.__dict__
+    for key, value in source.__dict__.items():
+        if key in _COPY_SKIP:
+            continue
+        if isinstance(value, Base):
+            child = target_dict.get(key)
+            if type(child) is type(value):
+                _copy_metadata_values(value, child)
+            else:
+                target_dict[key] = copy.deepcopy(value)
+        elif isinstance(value, _COPY_AS_IS):
+            target_dict[key] = value
+        elif isinstance(value, list):
+            target_dict[key] = [
+                clone_metadata(item) if isinstance(item, Base) else item
+                for item in value
+            ]
+        elif isinstance(value, dict):
+            target_dict[key] = {
+                k: clone_metadata(v) if isinstance(v, Base) else v
+                for k, v in value.items()
+            }
+        else:
+            target_dict[key] = copy.copy(value)
+
+
+def copy_metadata(source, target):
+    """
+    Copy the values of an already validated metadata object into another
+    metadata object of the same type without going through
+    to_dict/from_dict and validating every attribute again.
+
+    Nested metadata objects are copied into the existing objects of the
+    target, other mutable values are shallow copied so the objects don't
+    share state. Metadata objects in lists and dictionaries (runs,
+    channels, ...) are cloned with :func:`clone_metadata`.
+
+    :param source: metadata object to copy from
+    :type source: :class:`mt_metadata.base.Base`
+    :param target: metadata object to copy into
+    :type target: :class:`mt_metadata.base.Base`
+    :return: True if the values were copied, False if the objects are not
+     the same type and the caller needs to go through a dictionary
+    :rtype: boolean
+
+    """
+    if (
+        type(source) is not type(target)
+        or source._attr_dict is not target._attr_dict
+    ):
+        return False
+    _copy_metadata_values(source, target)
+    return True
+
+
+def from_flat_dict(metadata_object, meta_dict):
+    """
+    Fill a metadata object from a dictionary keyed by attribute name, without
+    wrapping it in {class_name: meta_dict} for `from_dict` to unwrap again.
+    Nested dictionaries are flattened to dotted names.
+
+    :param metadata_object: metadata object to fill
+    :type metadata_object: :class:`mt_metadata.base.Base`
+    :param meta_dict: dictionary of attribute names and values
+    :type meta_dict: dictionary
+
+    >>> from_flat_dict(electric, {"component": "ex", "dipole_length": 50})
+
+    """
+    for name, value in flatten_dict(meta_dict).items():
+        metadata_object.set_attr_from_name(name, value)
+
+
+def clone_metadata(metadata_object):
+    """
+    Make an independent copy of a metadata object without running its
+    constructor, which validates every default value.  Nested metadata
+    objects, lists and dictionaries are copied, the logger and attribute
+    dictionary are shared as they are for new objects of the same class.
+
+    Meant for cloning pristine objects that are used as templates, much
+    faster than building a new metadata object or `copy.deepcopy`.
+
+    :param metadata_object: metadata object to clone
+    :type metadata_object: :class:`mt_metadata.base.Base`
+    :return: new metadata object with the same values
+    :rtype: :class:`mt_metadata.base.Base`
+
+    """
+    clone = object.__new__(type(metadata_object))
+    clone_dict = clone.__dict__
+    for key, value in metadata_object.__dict__.items():
+        if key in _COPY_SKIP or isinstance(value, _COPY_AS_IS):
+            clone_dict[key] = value
+        elif isinstance(value, Base):
+            clone_dict[key] = clone_metadata(value)
+        elif isinstance(value, list):
+            clone_dict[key] = [
+                clone_metadata(item) if isinstance(item, Base) else item
+                for item in value
+            ]
+        elif isinstance(value, dict):
+            clone_dict[key] = {
+                k: clone_metadata(v) if isinstance(v, Base) else v
+                for k, v in value.items()
+            }
+        else:
+            clone_dict[key] = copy.copy(value)
+    return clone
+
+
 def validate_name(name, pattern=None):
     """
     Validate name 
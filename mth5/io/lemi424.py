@@ -15,6 +15,7 @@ import numpy as np
 import logging
 
 from mth5.timeseries import ChannelTS, RunTS
+from mth5.timeseries.channel_ts import get_channel_type
 from mt_metadata.timeseries import Station, Run
 
 
@@ -232,12 +233,7 @@ class LEMI424:
         for comp in (
             ["bx", "by", "bz"] + e_channels + ["temperature_e", "temperature_h"]
         ):
-            if comp[0] in ["h", "b"]:
-                ch = ChannelTS("magnetic")
-            elif comp[0] in ["e"]:
-                ch = ChannelTS("electric")
-            else:
-                ch = ChannelTS("auxiliary")
+            ch = ChannelTS(get_channel_type(comp))
 
             ch.sample_rate = self.sample_rate
             ch.start = self.start
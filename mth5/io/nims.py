@@ -31,7 +31,7 @@ NIMS
 # Imports
 # =============================================================================
 import os
-import struct
+import queue
 import datetime
 import dateutil
 import logging
@@ -40,6 +40,7 @@ import numpy as np
 import pandas as pd
 
 from mth5 import timeseries
+from mth5.timeseries.channel_ts import make_dt_coordinates
 
 # =============================================================================
 # Exceptions
@@ -56,6 +57,29 @@ class ResponseError(Exception):
     pass
 
 
+# =============================================================================
+# Read buffers
+# =============================================================================
+# initial size of a read buffer, grows to fit the largest file read
+_BUFFER_SIZE = 4 * 1024 ** 2
+# read buffers reused between files so reading many files does not allocate
+# a new buffer for each one
+_BUFFER_POOL = queue.SimpleQueue()
+
+
+def _get_buffer():
+    """get a read buffer from the pool or make a new one"""
+    try:
+        return _BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray(_BUFFER_SIZE)
+
+
+def _put_buffer(buffer):
+    """put a read buffer back in the pool once nothing points to it"""
+    _BUFFER_POOL.put(buffer)
+
+
 # =============================================================================
 # class objects
 # =============================================================================
@@ -585,25 +609,23 @@ class NIMSHeader(object):
         """
         read header information
 
-        :param fn: full path to file to read
-        :type fn: string or :class:`pathlib.Path`
+        :param fn: full path to file to read or an open binary file object
+        :type fn: string, :class:`pathlib.Path` or file object
         :raises: :class:`mth5.io.nims.NIMSError` if something is not right.
 
         """
         if fn is not None:
             self.fn = fn
 
-        if not os.path.exists(self.fn):
+        if not hasattr(self.fn, "read") and not os.path.exists(self.fn):
             msg = f"Could not find nims file {self.fn}"
             self.logger.error(msg)
             raise NIMSError(msg)
 
-        self.logger.info(f"Reading NIMS file {self.fn}")
+        self.logger.info(f"Reading NIMS file {getattr(self.fn, 'name', self.fn)}")
 
-        ### load in the entire file, its not too big
-        with open(self.fn, "rb") as fid:
-            header_str = fid.read(self._max_header_length)
-            header_list = header_str.split(b"\r")
+        header_str = self._read_bytes(0, self._max_header_length)
+        header_list = header_str.split(b"\r")
 
         self.header_dict = {}
         last_index = len(header_list)
@@ -638,6 +660,78 @@ class NIMSHeader(object):
 
         self.parse_header_dict()
 
+    def _read_bytes(self, offset=0, n_bytes=-1):
+        """
+        Read bytes from the file starting at offset.
+
+        `fn` can be a path or an open binary file object, like an entry of a
+        zip archive from :meth:`zipfile.ZipFile.open`, which is read in place
+        without extracting it to disk first.
+
+        :param offset: byte to start reading from, defaults to 0
+        :type offset: integer, optional
+        :param n_bytes: number of bytes to read, defaults to -1 (all)
+        :type n_bytes: integer, optional
+        :return: bytes read
+        :rtype: bytes
+
+        """
+        if hasattr(self.fn, "read"):
+            self.fn.seek(offset)
+            return self.fn.read(n_bytes)
+
+        with open(self.fn, "rb") as fid:
+            fid.seek(offset)
+            return fid.read(n_bytes)
+
+    def _read_into(self, buffer, offset=0):
+        """
+        Read from offset to the end of the file into a reusable buffer, a
+        larger buffer is made if the file does not fit.  Files on disk are
+        read to their size, file objects without a file number, like zip
+        archive entries, are read until the end of the data.
+
+        :param buffer: buffer to read into
+        :type buffer: bytearray
+        :param offset: byte to start reading from, defaults to 0
+        :type offset: integer, optional
+        :return: buffer, which is a new object if the file did not fit, and
+         the number of bytes read
+        :rtype: tuple (bytearray, integer)
+
+        """
+        if hasattr(self.fn, "read"):
+            fid = self.fn
+        else:
+            fid = open(self.fn, "rb")
+        try:
+            # the size of files on disk comes from the file system, entries
+            # of a zip archive are read to the end once, seeking to the end
+            # would inflate the entry again
+            try:
+                n_file = max(os.fstat(fid.fileno()).st_size - offset, 0)
+            except (AttributeError, OSError):
+                n_file = None
+            if n_file is not None and n_file > len(buffer):
+                buffer = bytearray(n_file)
+            fid.seek(offset)
+            n_bytes = 0
+            while n_file is None or n_bytes < n_file:
+                if n_bytes == len(buffer):
+                    new_buffer = bytearray(2 * max(len(buffer), 1))
+                    new_buffer[:n_bytes] = buffer
+                    buffer = new_buffer
+                stop = len(buffer) if n_file is None else n_file
+                with memoryview(buffer) as view, view[n_bytes:stop] as chunk:
+                    n_read = fid.readinto(chunk)
+                if not n_read:
+                    break
+                n_bytes += n_read
+        finally:
+            if fid is not self.fn:
+                fid.close()
+        return buffer, n_bytes
+
     def parse_header_dict(self, header_dict=None):
         """
         parse the header dictionary into something useful
@@ -746,8 +840,6 @@ class NIMS(NIMSHeader):
         self.gaps = None
         self.duplicate_list = None
 
-        self._raw_string = None
-
         self.indices = self._make_index_values()
 
     @property
@@ -1102,7 +1194,8 @@ class NIMS(NIMSHeader):
         then make a list by splitting by '$'.  The index values of where the
         '$' are found are also calculated.
 
-        :param str nims_string: raw binary string output by NIMS
+        :param nims_string: raw binary string output by NIMS
+        :type nims_string: bytes or np.ndarray of np.uint8
 
         :returns: list of index values associated with the location of the '$'
 
@@ -1112,15 +1205,12 @@ class NIMS(NIMSHeader):
                   Might be a bad assumption
         """
         ### get index values of $ and gps_strings
-        index_values = []
-        gps_str_list = []
-        for ii in range(int(len(nims_string) / self.block_size)):
-            index = ii * self.block_size + 3
-            g_char = struct.unpack("c", nims_string[index : index + 1])[0]
-            if g_char == b"$":
-                index_values.append((index - 3) / self.block_size)
-            gps_str_list.append(g_char)
-        gps_raw_stamp_list = b"".join(gps_str_list).split(b"$")
+        if not isinstance(nims_string, np.ndarray):
+            nims_string = np.frombuffer(nims_string, dtype=np.uint8)
+        n_blocks = int(nims_string.size / self.block_size)
+        gps_chars = nims_string[3 :: self.block_size][:n_blocks]
+        index_values = np.nonzero(gps_chars == ord("$"))[0].astype(float).tolist()
+        gps_raw_stamp_list = gps_chars.tobytes().split(b"$")
         return index_values, gps_raw_stamp_list
 
     def get_stamps(self, nims_string):
@@ -1421,7 +1511,8 @@ class NIMS(NIMSHeader):
         .. note:: The data and information array returned have the duplicates
                   removed and the sequence reset to be monotonic.
 
-        :param str fn: full path to DATA.BIN file
+        :param fn: full path to DATA.BIN file or an open binary file object
+        :type fn: string, :class:`pathlib.Path` or file object
 
         :Example:
 
@@ -1439,20 +1530,19 @@ class NIMS(NIMSHeader):
         self.read_header(self.fn)
 
         ### load in the entire file, its not too big, start from the
-        ### end of the header information.
-        with open(self.fn, "rb") as fid:
-            fid.seek(self.data_start_seek)
-            self._raw_string = fid.read()
+        ### end of the header information.  The bytes are read into a
+        ### buffer that is reused for the next file.
+        buffer, n_bytes = self._read_into(_get_buffer(), self.data_start_seek)
 
         ### read in full string as unsigned integers
-        data = np.frombuffer(self._raw_string, dtype=np.uint8)
+        data = np.frombuffer(buffer, dtype=np.uint8, count=n_bytes)
 
         ### need to make sure that the data starts with a full block
         find_first = self.find_sequence(data[0 : self.block_size * 5])[0]
         data = data[find_first:]
 
         ### get GPS stamps from the binary string first
-        self.gps_list = self.get_stamps(self._raw_string[find_first:])
+        self.gps_list = self.get_stamps(data)
 
         ### check the size of the data, should have an equal amount of blocks
         if (data.size % self.block_size) != 0:
@@ -1524,6 +1614,10 @@ class NIMS(NIMSHeader):
                 channel_arr[:, kk] = value
             data_array[comp][:] = channel_arr.flatten()
 
+        ### everything is copied out of the read buffer, give it back
+        del data
+        _put_buffer(buffer)
+
         ### clean things up
         ### I guess that the E channels are opposite phase?
         for comp in ["ex", "ey"]:
@@ -1713,9 +1807,9 @@ class NIMS(NIMSHeader):
                 start=start_time, end=stop_time, freq=dt_freq, closed="left", tz="UTC",
             )
         elif n_samples is not None:
-            dt_index = pd.date_range(
-                start=start_time, periods=n_samples, freq=dt_freq, tz="UTC"
-            )
+            dt_index = make_dt_coordinates(
+                start_time, sample_rate, n_samples, self.logger
+            ).tz_localize("UTC")
         else:
             raise ValueError("Need to input either stop_time or n_samples")
 
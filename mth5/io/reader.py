@@ -93,21 +93,28 @@ def get_reader(extension):
 def read_file(fn, file_type=None):
     """
 
-    :param fn: full path to file
-    :type fn: string or :class:`pathlib.Path`
+    :param fn: full path to file or an open binary file object, for instance
+     an entry of a zip archive from :meth:`zipfile.ZipFile.open`.  File
+     objects are passed straight to the reader, currently only the NIMS
+     reader supports them.
+    :type fn: string, :class:`pathlib.Path` or file object
     :param string file_type: a specific file time if the extension is ambiguous.
     :return: MT time series object
     :rtype: :class:`mth5.timeseries.MTTS`
 
     """
 
-    if not isinstance(fn, Path):
-        fn = Path(fn)
+    if hasattr(fn, "read"):
+        extension = Path(fn.name).suffix[1:]
+    else:
+        if not isinstance(fn, Path):
+            fn = Path(fn)
 
-    if not fn.exists():
-        msg = f"Could not find file {fn}. Check path."
-        logger.error(msg)
-        raise IOError(msg)
+        if not fn.exists():
+            msg = f"Could not find file {fn}. Check path."
+            logger.error(msg)
+            raise IOError(msg)
+        extension = fn.suffix[1:]
 
     if file_type is not None:
         try:
@@ -120,6 +127,6 @@ def read_file(fn, file_type=None):
             logger.error(msg)
             raise KeyError(msg)
     else:
-        file_type, file_reader = get_reader(fn.suffix[1:])
+        file_type, file_reader = get_reader(extension)
 
     return file_reader(fn)
@@ -26,6 +26,7 @@ import numpy as np
 import pandas as pd
 
 from mth5 import timeseries
+from mth5.timeseries.channel_ts import make_dt_coordinates
 from mt_metadata.utils.mttime import MTime
 
 # =============================================================================
@@ -639,11 +640,9 @@ class USGSasc(AsciiMetadata):
         self.ts = pd.read_csv(
             self.fn, delim_whitespace=True, skiprows=data_line, dtype=np.float32,
         )
-        dt_freq = "{0:.0f}N".format(1.0 / (self.AcqSmpFreq) * 1e9)
-        dt_index = pd.date_range(
-            start=self.AcqStartTime, periods=self.AcqNumSmp, freq=dt_freq
-        )
-        self.ts.index = dt_index
+        self.ts.index = make_dt_coordinates(
+            self._start, self.AcqSmpFreq, self.AcqNumSmp, self.logger
+        ).tz_localize("UTC")
         self.ts.columns = self.ts.columns.str.lower()
 
         et = datetime.datetime.now()
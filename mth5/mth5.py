@@ -566,10 +566,37 @@ class MTH5:
                 station_list += sg.stations_group.groups_list
             return station_list
 
-    def open_mth5(self, filename=None, mode="a"):
+    def open_mth5(
+        self,
+        filename=None,
+        mode="a",
+        rdcc_nbytes=256 * 1024 ** 2,
+        rdcc_nslots=100003,
+        rdcc_w0=0.75,
+    ):
         """
         open an mth5 file
 
+        The raw data chunk cache is set when the file is opened.  The HDF5
+        default is 1 MiB with 521 slots per dataset, which is too small when
+        writing or reading many chunks of long channels and leads to chunks
+        being evicted and decompressed over and over.  A good size is about
+        10 x (chunk size in bytes) x (number of chunks accessed at once), the
+        cache is only filled as chunks are touched.
+
+        :param filename: name of the file to open
+        :type filename: string or :class:`pathlib.Path`, optional
+        :param mode: file mode [ 'r' | 'r+' | 'a' | 'w' | 'w-' | 'x' ]
+        :type mode: string, defaults to 'a'
+        :param rdcc_nbytes: size of the raw data chunk cache in bytes for
+         each dataset
+        :type rdcc_nbytes: integer, defaults to 256 MiB
+        :param rdcc_nslots: number of hash slots in the chunk cache, should
+         be a prime number about 100 times the number of chunks in the cache
+        :type rdcc_nslots: integer, defaults to 100003
+        :param rdcc_w0: chunk eviction policy, 0 evicts least recently used
+         chunks first, 1 evicts fully read or written chunks first
+        :type rdcc_w0: float, defaults to 0.75
         :return: Survey Group
         :type: groups.SurveyGroup
 
@@ -591,13 +618,18 @@ class MTH5:
             self.__filename = filename
         if not isinstance(self.__filename, Path):
             self.__filename = Path(filename)
+        cache_options = {
+            "rdcc_nbytes": rdcc_nbytes,
+            "rdcc_nslots": rdcc_nslots,
+            "rdcc_w0": rdcc_w0,
+        }
         if self.__filename.exists():
             if mode in ["w"]:
                 self.logger.warning(
                     f"{self.__filename.name} will be overwritten in 'w' mode"
                 )
                 try:
-                    self._initialize_file(mode)
+                    self._initialize_file(mode, **cache_options)
                 except OSError as error:
                     msg = (
                         f"{error}. Need to close any references to {self.__filename} first. "
@@ -605,14 +637,18 @@ class MTH5:
                     )
                     self.logger.exception(msg)
             elif mode in ["a", "w-", "x", "r+"]:
-                self.__hdf5_obj = h5py.File(self.__filename, mode=mode)
+                self.__hdf5_obj = h5py.File(
+                    self.__filename, mode=mode, **cache_options
+                )
                 self._set_default_groups()
                 if not self.validate_file():
                     msg = "Input file is not a valid MTH5 file"
                     self.logger.error(msg)
                     raise MTH5Error(msg)
             elif mode in ["r"]:
-                self.__hdf5_obj = h5py.File(self.__filename, mode=mode)
+                self.__hdf5_obj = h5py.File(
+                    self.__filename, mode=mode, **cache_options
+                )
                 self._set_default_groups()
                 self.validate_file()
             else:
@@ -621,7 +657,7 @@ class MTH5:
                 raise MTH5Error(msg)
         else:
             if mode in ["a", "w", "w-", "x"]:
-                self._initialize_file(mode=mode)
+                self._initialize_file(mode=mode, **cache_options)
             else:
                 msg = "Cannot open new file in mode {0} ".format(mode)
                 self.logger.error(msg)
@@ -630,29 +666,33 @@ class MTH5:
         if not "channel_summary" in self.__hdf5_obj[self._root_path].keys():
             self._initialize_summary()
 
-    def _initialize_file(self, mode="w"):
+    def _initialize_file(self, mode="w", **kwargs):
         """
         Initialize the default groups for the file
 
+        :param kwargs: keyword arguments passed to :class:`h5py.File`, like
+         the chunk cache parameters.
         :return: Survey Group
         :rtype: groups.SurveyGroup
 
         """
         # open an hdf5 file
-        self.__hdf5_obj = h5py.File(self.__filename, mode)
+        self.__hdf5_obj = h5py.File(self.__filename, mode, **kwargs)
 
         # write general metadata
         self.__hdf5_obj.attrs.update(self.file_attributes)
 
         # create the default group
-        root = self.__hdf5_obj.create_group(self._default_root_name)
+        root = helpers.create_metadata_group(
+            self.__hdf5_obj, self._default_root_name
+        )
         if self._default_root_name == "Survey":
             root_group = groups.SurveyGroup(root)
             root_group.write_metadata()
         for group_name in self._default_subgroup_names:
             try:
-                self.__hdf5_obj.create_group(
-                    f"{self._default_root_name}/{group_name}"
+                helpers.create_metadata_group(
+                    self.__hdf5_obj, f"{self._default_root_name}/{group_name}"
                 )
             except ValueError:
                 pass
@@ -1211,7 +1251,7 @@ class MTH5:
             survey = helpers.validate_name(survey)
             run_path = f"{self._root_path}/Surveys/{survey}/Stations/{station_name}/{run_name}"
         try:
-            return groups.RunGroup(self.__hdf5_obj[run_path])
+            return groups.RunGroup(self.__hdf5_obj[run_path], **self.dataset_options)
         except KeyError:
             raise MTH5Error(f"Could not find {run_path}")
 
@@ -10,7 +10,6 @@ Created on Wed Dec 23 16:53:55 2020
 # =============================================================================
 # Imports
 # =============================================================================
-import weakref
 import copy
 
 import h5py
@@ -39,7 +38,7 @@ class MTH5Table:
 
         self.hdf5_reference = None
         if isinstance(hdf5_dataset, h5py.Dataset):
-            self.array = weakref.ref(hdf5_dataset)()
+            self.array = hdf5_dataset
             self.hdf5_reference = hdf5_dataset.ref
         else:
             msg = "Input must be a h5py.Dataset not {0}".format(type(hdf5_dataset))
@@ -18,11 +18,15 @@ convert them back if read in.
 # ==============================================================================
 # Imports
 # ==============================================================================
-import inspect
 
+import copy
+
+import h5py
 import numpy as np
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
 import xarray as xr
+from scipy import signal
 
 from mt_metadata import timeseries as metadata
 from mt_metadata.utils.mttime import MTime
@@ -30,6 +34,13 @@ from mt_metadata.timeseries.filters import ChannelResponseFilter
 
 from mth5.utils.exceptions import MTTSError
 from mth5.utils.mth5_logger import setup_logger
+from mth5.helpers import (
+    get_module_classes,
+    copy_metadata,
+    metadata_items,
+    clone_metadata,
+    from_flat_dict,
+)
 from mth5.utils import fdsn_tools
 from mth5.timeseries.ts_filters import RemoveInstrumentResponse
 
@@ -38,7 +49,33 @@ from obspy.core import Trace
 # =============================================================================
 # make a dictionary of available metadata classes
 # =============================================================================
-meta_classes = dict(inspect.getmembers(metadata, inspect.isclass))
+meta_classes = get_module_classes(metadata)
+
+# pristine metadata objects to clone, building a new metadata object validates
+# every default value and is the slowest part of making a ChannelTS
+_METADATA_PROTOTYPES = {}
+
+
+def new_metadata(name):
+    """
+    Get a new metadata object cloned from a cached prototype of the class.
+
+    :param name: metadata class name [ Electric | Magnetic | Auxiliary | ... ]
+    :type name: string
+    :return: new metadata object with default values
+    :rtype: :class:`mt_metadata.base.Base`
+    :raises KeyError: if name is not a metadata class
+
+    """
+    try:
+        prototype = _METADATA_PROTOTYPES[name]
+    except KeyError:
+        prototype = _METADATA_PROTOTYPES[name] = meta_classes[name]()
+    return clone_metadata(prototype)
+
+
+# arrays larger than this are stored as dask arrays when dask is installed
+DASK_NBYTES = 512 * 1024 ** 2
 
 
 def make_dt_coordinates(start_time, sample_rate, n_samples, logger):
@@ -75,18 +112,80 @@ def make_dt_coordinates(start_time, sample_rate, n_samples, logger):
         raise ValueError(msg)
     if not isinstance(start_time, MTime):
         start_time = MTime(start_time)
-    dt_freq = "{0:.0f}N".format(1.0e9 / (sample_rate))
-
-    dt_index = pd.date_range(
-        start=start_time.iso_str.split("+", 1)[0],
-        periods=n_samples,
-        freq=dt_freq,
-        closed=None,
-    )
+    # step in whole nanoseconds, same rounding as a pandas "{n}N" frequency,
+    # build the index with integer arithmetic instead of pd.date_range
+    dt_step = np.int64(round(1.0e9 / sample_rate))
+    dt_start = np.datetime64(start_time.iso_str.split("+", 1)[0], "ns")
+
+    # fill a single int64 buffer in place and view it as datetime64, the
+    # index then owns that buffer without any temporary copies.
+    dt_ns = np.arange(n_samples, dtype=np.int64)
+    dt_ns *= dt_step
+    dt_ns += dt_start.astype(np.int64)
+    dt_index = pd.DatetimeIndex(dt_ns.view("datetime64[ns]"), copy=False)
 
     return dt_index
 
 
+# channel type from the first letter of the component, otherwise auxiliary
+_CHANNEL_TYPES = {"e": "electric", "h": "magnetic", "b": "magnetic"}
+
+
+def get_channel_type(component):
+    """
+    Get the channel type from the component name, components starting with
+    e are electric, h or b are magnetic and anything else is auxiliary.
+
+    :param component: channel component
+    :type component: string
+    :return: [ electric | magnetic | auxiliary ]
+    :rtype: string
+
+    """
+    return _CHANNEL_TYPES.get(component[:1].lower(), "auxiliary")
+
+
+def datetime64_to_mtime(value):
+    """
+    Make an :class:`MTime` from a time index value without formatting and
+    parsing a time string.  MTime holds microseconds, smaller parts of the
+    time are dropped the same as when parsing the ISO string.
+
+    :param value: time index value
+    :type value: :class:`numpy.datetime64` or :class:`pandas.Timestamp`
+    :return: time as an MTime object
+    :rtype: :class:`MTime`
+
+    """
+    return MTime(np.datetime64(value, "us").tolist())
+
+
+def make_obspy_header(channel_metadata, start, sample_rate, station_id):
+    """
+    Make the header of an :class:`obspy.core.trace.Trace` for a channel,
+    used by `ChannelTS.to_obspy_trace` and `RunTS.to_obspy_stream`.
+
+    :param channel_metadata: channel metadata, the channel code is made from
+        the type, component, sample rate, azimuth and tilt
+    :type channel_metadata: :class:`mt_metadata.timeseries.Channel`
+    :param start: start time of the channel
+    :type start: :class:`MTime`
+    :param sample_rate: sample rate in samples/second, rounded to an integer
+    :type sample_rate: float
+    :param station_id: FDSN station id
+    :type station_id: string
+    :return: trace header
+    :rtype: dictionary
+
+    """
+    return {
+        "channel": fdsn_tools.make_channel_code(channel_metadata),
+        "starttime": start.iso_str,
+        "sampling_rate": np.round(sample_rate, 0),
+        "station": station_id,
+    }
+
+
 # ==============================================================================
 # Channel Time Series Object
 # ==============================================================================
@@ -141,6 +240,28 @@ class ChannelTS:
                 End          = 2020-01-01T12:08:31.875000+00:00
                 N Samples    = 4096
 
+    Large data
+    ------------
+
+    If dask is installed, arrays larger than `DASK_NBYTES`, arrays given
+    with `chunks` and :class:`h5py.Dataset` objects are stored as a
+    :class:`dask.array.Array`, so data are only read or computed when
+    needed.  `get_slice` stays lazy and `ts` computes the data.  The default
+    chunk size is one hour of samples, or dask's "auto" chunks if the sample
+    rate is not set.
+
+        >>> ts_obj = ChannelTS('auxiliary', chunks=8 * 3600)
+        >>> ts_obj.ts = mth5_obj.get_channel('MT001', 'MT001a', 'temperature').hdf5_dataset
+
+    Data type
+    -----------
+
+    Data keep the data type they are given in, integer counts are not
+    converted to float until calibrated with `apply_calibration`.  Use
+    `dtype` to cast the input data, for example to store counts as int32.
+
+        >>> ts_obj = ChannelTS('electric', data=counts, dtype=np.int32)
+
     Plot time series with xarray
     ------------------------------
 
@@ -157,98 +278,129 @@ class ChannelTS:
         channel_metadata=None,
         station_metadata=None,
         run_metadata=None,
+        chunks=None,
+        dtype=None,
+        _trusted=False,
         **kwargs,
     ):
 
         self.logger = setup_logger(f"{__name__}.{self.__class__.__name__}")
-        self.station_metadata = metadata.Station()
-        self.run_metadata = metadata.Run()
+        self.chunks = chunks
         self._ts = xr.DataArray([1], coords=[("time", [1])], name="ts")
+        self._time_cache = (None, None, False, 0.0)
+        self._endpoint_cache = (None, None, None)
         self._channel_response = ChannelResponseFilter()
 
-        # get correct metadata class
-        try:
-            self.channel_metadata = meta_classes[channel_type.capitalize()]()
-            self.channel_metadata.type = channel_type.lower()
-        except KeyError:
-            msg = (
-                "Channel type is undefined, must be [ electric | "
-                + "magnetic | auxiliary ]"
-            )
-            self.logger.error(msg)
-            raise ValueError(msg)
-        if channel_metadata is not None:
-            if isinstance(channel_metadata, type(self.channel_metadata)):
-                self.channel_metadata.update(channel_metadata)
-                self.logger.debug(
-                    "Loading from metadata class {0}".format(
-                        type(self.channel_metadata)
-                    )
-                )
-            elif isinstance(channel_metadata, dict):
-                if not channel_type in [cc.lower() for cc in channel_metadata.keys()]:
-                    channel_metadata = {channel_type: channel_metadata}
-                self.channel_metadata.from_dict(channel_metadata)
-                self.logger.debug("Loading from metadata dict")
-            else:
-                msg = "input metadata must be type %s or dict, not %s"
-                self.logger.error(
-                    msg, type(self.channel_metadata), type(channel_metadata)
-                )
-                raise MTTSError(
-                    msg % (type(self.channel_metadata), type(channel_metadata))
-                )
-        # add station metadata, this will be important when propogating a single
-        # channel such that it can stand alone.
-        if station_metadata is not None:
-            if isinstance(station_metadata, metadata.Station):
-                self.station_metadata.update(station_metadata)
-            elif isinstance(station_metadata, dict):
-                if not "station" in [cc.lower() for cc in station_metadata.keys()]:
-                    station_metadata = {"Station": station_metadata}
-                self.station_metadata.from_dict(station_metadata)
-                self.logger.debug("Loading from metadata dict")
-            else:
-                msg = "input metadata must be type {0} or dict, not {1}".format(
-                    type(self.station_metadata), type(station_metadata)
+        if _trusted:
+            # internal callers hand over metadata objects of the right types,
+            # clone them directly without parsing or validating the input
+            self.channel_metadata = clone_metadata(channel_metadata)
+            self.station_metadata = clone_metadata(station_metadata)
+            self.run_metadata = clone_metadata(run_metadata)
+        else:
+            self.station_metadata = new_metadata("Station")
+            self.run_metadata = new_metadata("Run")
+
+            # get correct metadata class
+            try:
+                self.channel_metadata = new_metadata(channel_type.capitalize())
+                self.channel_metadata.type = channel_type.lower()
+            except KeyError:
+                msg = (
+                    "Channel type is undefined, must be [ electric | "
+                    + "magnetic | auxiliary ]"
                 )
                 self.logger.error(msg)
-                raise MTTSError(msg)
-        # add run metadata, this will be important when propogating a single
-        # channel such that it can stand alone.
-        if run_metadata is not None:
-            if isinstance(run_metadata, metadata.Run):
-                self.run_metadata.update(run_metadata)
-            elif isinstance(run_metadata, dict):
-                if not "run" in [cc.lower() for cc in run_metadata.keys()]:
-                    run_metadata = {"Run": run_metadata}
-                self.run_metadata.from_dict(run_metadata)
-                self.logger.debug("Loading from metadata dict")
-            else:
-                msg = "input metadata must be type %s or dict, not %s"
-                self.logger.error(msg, type(self.run_metadata), type(run_metadata))
-                raise MTTSError(msg % (type(self.run_metadata), type(run_metadata)))
+                raise ValueError(msg)
+            if channel_metadata is not None:
+                if isinstance(channel_metadata, type(self.channel_metadata)):
+                    if not copy_metadata(channel_metadata, self.channel_metadata):
+                        self.channel_metadata.update(channel_metadata)
+                    self.logger.debug(
+                        "Loading from metadata class {0}".format(
+                            type(self.channel_metadata)
+                        )
+                    )
+                elif isinstance(channel_metadata, dict):
+                    if any(cc.lower() == channel_type for cc in channel_metadata):
+                        self.channel_metadata.from_dict(channel_metadata)
+                    else:
+                        from_flat_dict(self.channel_metadata, channel_metadata)
+                    self.logger.debug("Loading from metadata dict")
+                else:
+                    msg = "input metadata must be type %s or dict, not %s"
+                    self.logger.error(
+                        msg, type(self.channel_metadata), type(channel_metadata)
+                    )
+                    raise MTTSError(
+                        msg % (type(self.channel_metadata), type(channel_metadata))
+                    )
+            # add station metadata, this will be important when propogating a single
+            # channel such that it can stand alone.
+            if station_metadata is not None:
+                if isinstance(station_metadata, metadata.Station):
+                    if not copy_metadata(station_metadata, self.station_metadata):
+                        self.station_metadata.update(station_metadata)
+                elif isinstance(station_metadata, dict):
+                    if any(cc.lower() == "station" for cc in station_metadata):
+                        self.station_metadata.from_dict(station_metadata)
+                    else:
+                        from_flat_dict(self.station_metadata, station_metadata)
+                    self.logger.debug("Loading from metadata dict")
+                else:
+                    msg = "input metadata must be type {0} or dict, not {1}".format(
+                        type(self.station_metadata), type(station_metadata)
+                    )
+                    self.logger.error(msg)
+                    raise MTTSError(msg)
+            # add run metadata, this will be important when propogating a single
+            # channel such that it can stand alone.
+            if run_metadata is not None:
+                if isinstance(run_metadata, metadata.Run):
+                    if not copy_metadata(run_metadata, self.run_metadata):
+                        self.run_metadata.update(run_metadata)
+                elif isinstance(run_metadata, dict):
+                    if any(cc.lower() == "run" for cc in run_metadata):
+                        self.run_metadata.from_dict(run_metadata)
+                    else:
+                        from_flat_dict(self.run_metadata, run_metadata)
+                    self.logger.debug("Loading from metadata dict")
+                else:
+                    msg = "input metadata must be type %s or dict, not %s"
+                    self.logger.error(msg, type(self.run_metadata), type(run_metadata))
+                    raise MTTSError(msg % (type(self.run_metadata), type(run_metadata)))
         # input data
+        # setting ts already updates the xarray attributes
         if data is not None:
+            if dtype is not None and isinstance(data, (np.ndarray, list, tuple)):
+                data = np.asarray(data, dtype=dtype)
             self.ts = data
-        self._update_xarray_metadata()
+        else:
+            self._update_xarray_metadata()
 
         for key in list(kwargs.keys()):
             setattr(self, key, kwargs[key])
 
     def __str__(self):
-        lines = [
-            f"Station:      {self.station_metadata.id}",
-            f"Run:          {self.run_metadata.id}",
-            f"Channel Type: {self.channel_type}",
-            f"Component:    {self.component}",
-            f"Sample Rate:  {self.sample_rate}",
-            f"Start:        {self.start}",
-            f"End:          {self.end}",
-            f"N Samples:    {self.n_samples}",
-        ]
-
-        return "\n\t".join(["Channel Summary:"] + lines)
+        # use the cached end points as is, start and end return copies and
+        # without data would parse the metadata time strings again
+        if self.has_data:
+            start, end = self._get_endpoints()
+        else:
+            start = self.channel_metadata.time_period.start
+            end = self.channel_metadata.time_period.end
+
+        return (
+            "Channel Summary:\n\t"
+            f"Station:      {self.station_metadata.id}\n\t"
+            f"Run:          {self.run_metadata.id}\n\t"
+            f"Channel Type: {self.channel_type}\n\t"
+            f"Component:    {self.component}\n\t"
+            f"Sample Rate:  {self.sample_rate}\n\t"
+            f"Start:        {start}\n\t"
+            f"End:          {end}\n\t"
+            f"N Samples:    {self.n_samples}"
+        )
 
     def __repr__(self):
         return self.__str__()
@@ -257,9 +409,9 @@ class ChannelTS:
 
         if not isinstance(other, ChannelTS):
             raise ValueError(f"Cannot compare ChannelTS with {type(other)}")
-        if not other.metadata == self.channel_metadata:
+        if not other.channel_metadata == self.channel_metadata:
             return False
-        if self.ts.equals(other.ts) is False:
+        if not np.array_equal(self.ts, other.ts):
             msg = "timeseries are not equal"
             self.logger.info(msg)
             return False
@@ -282,7 +434,8 @@ class ChannelTS:
     ### Properties ------------------------------------------------------------
     @property
     def ts(self):
-        return self._ts.data
+        """time series data as a numpy array, lazy data are computed"""
+        return self._ts.values
 
     @ts.setter
     def ts(self, ts_arr):
@@ -290,10 +443,13 @@ class ChannelTS:
         if setting ts with a pandas data frame, make sure the data is in a
         column name 'data'
         """
+        self._reset_time_cache()
 
-        if isinstance(ts_arr, (np.ndarray, list, tuple)):
-            if not isinstance(ts_arr, np.ndarray):
+        if isinstance(ts_arr, (np.ndarray, list, tuple, h5py.Dataset)):
+            # arrays are not copied, xarray wraps the input buffer as is
+            if isinstance(ts_arr, (list, tuple)):
                 ts_arr = np.array(ts_arr)
+            ts_arr = self._to_lazy_array(ts_arr)
             # Validate an input array to make sure its 1D
             if len(ts_arr.shape) == 2:
                 if 1 in ts_arr.shape:
@@ -302,13 +458,18 @@ class ChannelTS:
                     msg = f"Input array must be 1-D array not {ts_arr.shape}"
                     self.logger.error(msg)
                     raise ValueError(msg)
+            # strided views, a column of a 2-D array for example, are copied
+            # once here so filters and FFTs work on contiguous memory
+            if isinstance(ts_arr, np.ndarray):
+                ts_arr = np.ascontiguousarray(ts_arr)
             dt = make_dt_coordinates(
                 self.start, self.sample_rate, ts_arr.size, self.logger
             )
             self._ts = xr.DataArray(ts_arr, coords=[("time", dt)], name="ts")
+            self._set_uniform_time_cache()
             self._update_xarray_metadata()
         elif isinstance(ts_arr, pd.core.frame.DataFrame):
-            if isinstance(ts_arr.index[0], pd._libs.tslibs.timestamps.Timestamp):
+            if is_datetime64_any_dtype(ts_arr.index):
                 dt = ts_arr.index
             else:
                 dt = make_dt_coordinates(
@@ -316,7 +477,9 @@ class ChannelTS:
                 )
             try:
                 self._ts = xr.DataArray(
-                    ts_arr["data"], coords=[("time", dt)], name="ts"
+                    np.ascontiguousarray(ts_arr["data"].values),
+                    coords=[("time", dt)],
+                    name="ts",
                 )
                 self._update_xarray_metadata()
             except AttributeError:
@@ -327,16 +490,21 @@ class ChannelTS:
                 self.logger.error(msg)
                 raise MTTSError(msg)
         elif isinstance(ts_arr, pd.core.series.Series):
-            if isinstance(ts_arr.index[0], pd._libs.tslibs.timestamps.Timestamp):
+            if is_datetime64_any_dtype(ts_arr.index):
                 dt = ts_arr.index
             else:
                 dt = make_dt_coordinates(
                     self.start, self.sample_rate, ts_arr["data"].size, self.logger,
                 )
-            self._ts = xr.DataArray(ts_arr.values, coords=[("time", dt)], name="ts")
+            self._ts = xr.DataArray(
+                np.ascontiguousarray(ts_arr.values), coords=[("time", dt)], name="ts"
+            )
             self._update_xarray_metadata()
         elif isinstance(ts_arr, xr.DataArray):
             # TODO: need to validate the input xarray
+            if isinstance(ts_arr.data, np.ndarray):
+                if not ts_arr.data.flags["C_CONTIGUOUS"]:
+                    ts_arr = ts_arr.copy(data=np.ascontiguousarray(ts_arr.data))
             self._ts = ts_arr
             # need to pull out the metadata as a separate dictionary
             meta_dict = dict([(k, v) for k, v in ts_arr.attrs.items()])
@@ -350,9 +518,9 @@ class ChannelTS:
                 station_dict[key.split("station.")[-1]] = meta_dict.pop(key)
             for key in run_keys:
                 run_dict[key.split("run.")[-1]] = meta_dict.pop(key)
-            self.channel_metadata.from_dict({meta_dict["type"]: meta_dict})
-            self.station_metadata.from_dict({"station": station_dict})
-            self.run_metadata.from_dict({"run": run_dict})
+            from_flat_dict(self.channel_metadata, meta_dict)
+            from_flat_dict(self.station_metadata, station_dict)
+            from_flat_dict(self.run_metadata, run_dict)
             # need to run this incase things are different.
             self._update_xarray_metadata()
         else:
@@ -363,6 +531,104 @@ class ChannelTS:
             )
             raise MTTSError(msg)
 
+    def _to_lazy_array(self, ts_arr):
+        """
+        Wrap large arrays, arrays with `chunks` set and h5py datasets in a
+        dask array.  Without dask arrays are returned as is and h5py datasets
+        are read into memory.
+
+        Chunks are one hour of data, or dask's byte based "auto" chunks if
+        the sample rate is not set yet.  Slicing, scaling with
+        `apply_calibration` and `to_xarray` stay lazy; `ts` and comparisons
+        compute the whole array.
+
+        :param ts_arr: time series data
+        :type ts_arr: np.ndarray or :class:`h5py.Dataset`
+        :return: time series data
+        :rtype: np.ndarray or :class:`dask.array.Array`
+
+        """
+        if not (
+            isinstance(ts_arr, h5py.Dataset)
+            or self.chunks is not None
+            or ts_arr.nbytes > DASK_NBYTES
+        ):
+            return ts_arr
+        try:
+            import dask.array as da
+        except ImportError:
+            self.logger.debug("dask is not installed, data are kept in memory")
+            if isinstance(ts_arr, h5py.Dataset):
+                return ts_arr[()]
+            return ts_arr
+
+        chunks = self.chunks
+        if chunks is None:
+            chunks = "auto"
+            if self.sample_rate > 0:
+                chunks = max(int(self.sample_rate * 3600), 1)
+        return da.from_array(ts_arr, chunks=chunks)
+
+    def _reset_time_cache(self):
+        """reset the cached time index, call if the time coordinate changes"""
+        self._time_cache = (None, None, False, 0.0)
+        self._endpoint_cache = (None, None, None)
+
+    def _set_uniform_time_cache(self):
+        """
+        Fill the time cache for a time index made with `make_dt_coordinates`.
+        The samples are equally spaced, so the sample rate comes from the
+        first step, the same value the median step of the index would give.
+        """
+        index = self._ts.indexes["time"]
+        has_data = len(index) > 1
+        sr = 0.0
+        if has_data:
+            step = np.timedelta64(index.asi8[1] - index.asi8[0], "ns")
+            sr = 1.0 / np.float64(step / np.timedelta64(1, "s"))
+        self._time_cache = (self._ts, index, has_data, sr)
+
+    def _get_endpoints(self):
+        """
+        Get the first and last time of the index as :class:`MTime` objects,
+        parsed once for each xarray object stored in `_ts`.  Return copies,
+        MTime objects can be changed in place.
+
+        :return: start time, end time
+        :rtype: tuple (:class:`MTime`, :class:`MTime`)
+
+        """
+        if self._endpoint_cache[0] is not self._ts:
+            index = self._get_time_cache()[0]
+            self._endpoint_cache = (
+                self._ts,
+                datetime64_to_mtime(index.values[0]),
+                datetime64_to_mtime(index.values[-1]),
+            )
+        return self._endpoint_cache[1:]
+
+    def _get_time_cache(self):
+        """
+        Get the time index, whether there is data and the sample rate estimated
+        from the time index.  These are computed once for each xarray object
+        stored in `_ts` and reused until `_ts` is replaced or the cache is
+        reset.
+
+        :return: time index, has data, sample rate
+        :rtype: tuple (pandas.Index, bool, float)
+
+        """
+        if self._time_cache[0] is not self._ts:
+            index = self._ts.indexes["time"]
+            has_data = len(index) > 1 and is_datetime64_any_dtype(index)
+            sr = 0.0
+            if has_data:
+                sr = 1.0 / np.float64(
+                    (np.median(np.diff(index)) / np.timedelta64(1, "s"))
+                )
+            self._time_cache = (self._ts, index, has_data, sr)
+        return self._time_cache[1:]
+
     @property
     def time_index(self):
         """
@@ -385,7 +651,7 @@ class ChannelTS:
         if value.lower() != self.channel_metadata._class_name.lower():
             m_dict = self.channel_metadata.to_dict()[self.channel_metadata._class_name]
             try:
-                self.channel_metadata = meta_classes[value.capitalize()]()
+                self.channel_metadata = new_metadata(value.capitalize())
                 msg = (
                     f"Changing metadata to {value.capitalize()}"
                     + "will translate any similar attributes."
@@ -406,7 +672,7 @@ class ChannelTS:
                     pass
         return
 
-    def _update_xarray_metadata(self):
+    def _update_xarray_metadata(self, time_only=False):
         """
         Update xarray attrs dictionary with metadata.  Here we are assuming that
         self.channel_metadata is the parent and attrs in xarray are children because all
@@ -418,6 +684,11 @@ class ChannelTS:
         This should be mainly used internally but gives the user a way to update
         metadata.
 
+        :param time_only: only update the start, end and sample rate
+         attributes, for setters that change nothing else. `to_xarray` always
+         updates everything. Defaults to False
+        :type time_only: boolean, optional
+
         """
         self.logger.debug("Updating xarray attributes")
 
@@ -425,9 +696,14 @@ class ChannelTS:
         self.channel_metadata.time_period.end = self.end.iso_no_tz
         self.channel_metadata.sample_rate = self.sample_rate
 
-        self._ts.attrs.update(
-            self.channel_metadata.to_dict()[self.channel_metadata._class_name]
-        )
+        if time_only:
+            attrs = self._ts.attrs
+            attrs["time_period.start"] = self.channel_metadata.time_period.start
+            attrs["time_period.end"] = self.channel_metadata.time_period.end
+            attrs["sample_rate"] = self.channel_metadata.sample_rate
+            return
+
+        self._ts.attrs.update(metadata_items(self.channel_metadata))
         # add station and run id's here, for now this is all we need but may need
         # more metadata down the road.
         self._ts.attrs["station.id"] = self.station_metadata.id
@@ -441,26 +717,12 @@ class ChannelTS:
     @component.setter
     def component(self, comp):
         """set component in metadata and carry through"""
-        if self.channel_metadata.type == "electric":
-            if comp[0].lower() != "e":
+        ch_type = self.channel_metadata.type
+        if ch_type in ["electric", "magnetic", "auxiliary"]:
+            if get_channel_type(comp) != ch_type:
+                article = "a" if ch_type == "magnetic" else "an"
                 msg = (
-                    "The current timeseries is an electric channel. "
-                    "Cannot change channel type, create a new ChannelTS object."
-                )
-                self.logger.error(msg)
-                raise MTTSError(msg)
-        elif self.channel_metadata.type == "magnetic":
-            if comp[0].lower() not in ["h", "b"]:
-                msg = (
-                    "The current timeseries is a magnetic channel. "
-                    "Cannot change channel type, create a new ChannelTS object."
-                )
-                self.logger.error(msg)
-                raise MTTSError(msg)
-        if self.channel_metadata.type == "auxiliary":
-            if comp[0].lower() in ["e", "h", "b"]:
-                msg = (
-                    "The current timeseries is an auxiliary channel. "
+                    f"The current timeseries is {article} {ch_type} channel. "
                     "Cannot change channel type, create a new ChannelTS object."
                 )
                 self.logger.error(msg)
@@ -472,7 +734,7 @@ class ChannelTS:
     @property
     def n_samples(self):
         """number of samples"""
-        return int(self.ts.size)
+        return int(self._ts.size)
 
     @n_samples.setter
     def n_samples(self, n_samples):
@@ -486,27 +748,14 @@ class ChannelTS:
         """
         check to see if there is an index in the time series
         """
-        if len(self._ts) > 1:
-            if isinstance(
-                self._ts.indexes["time"][0], pd._libs.tslibs.timestamps.Timestamp,
-            ):
-                return True
-            return False
-        else:
-            return False
+        return self._get_time_cache()[1]
 
     # --> sample rate
     @property
     def sample_rate(self):
         """sample rate in samples/second"""
-        if self.has_data:
-            sr = 1.0 / np.float64(
-                (
-                    np.median(np.diff(self._ts.coords.indexes["time"]))
-                    / np.timedelta64(1, "s")
-                )
-            )
-        else:
+        index, has_data, sr = self._get_time_cache()
+        if not has_data:
             self.logger.debug("Data has not been set yet, sample rate is from metadata")
             sr = self.channel_metadata.sample_rate
             if sr is None:
@@ -534,13 +783,15 @@ class ChannelTS:
                 self.start, sample_rate, self.n_samples, self.logger
             )
             self._ts.coords["time"] = new_dt
+            self._reset_time_cache()
+            self._set_uniform_time_cache()
         else:
             if self.channel_metadata.sample_rate not in [0.0, None]:
                 self.logger.warning(
                     f"Resetting ChannelTS.channel_metadata.sample_rate to {sample_rate}. "
                 )
             self.channel_metadata.sample_rate = sample_rate
-        self._update_xarray_metadata()
+        self._update_xarray_metadata(time_only=True)
 
     @property
     def sample_interval(self):
@@ -559,8 +810,9 @@ class ChannelTS:
     @property
     def start(self):
         """MTime object"""
-        if self.has_data:
-            return MTime(self._ts.coords.indexes["time"][0].isoformat())
+        index, has_data, sr = self._get_time_cache()
+        if has_data:
+            return copy.copy(self._get_endpoints()[0])
         else:
             self.logger.debug(
                 "Data not set yet, pulling start time from "
@@ -588,23 +840,26 @@ class ChannelTS:
             start_time = MTime(start_time)
         self.channel_metadata.time_period.start = start_time.iso_str
         if self.has_data:
-            if start_time == MTime(self._ts.coords.indexes["time"][0].isoformat()):
+            if start_time == self._get_endpoints()[0]:
                 return
             else:
                 new_dt = make_dt_coordinates(
                     start_time, self.sample_rate, self.n_samples, self.logger
                 )
                 self._ts.coords["time"] = new_dt
+                self._reset_time_cache()
+                self._set_uniform_time_cache()
         # make a time series that the data can be indexed by
         else:
             self.logger.debug("No data, just updating metadata start")
-        self._update_xarray_metadata()
+        self._update_xarray_metadata(time_only=True)
 
     @property
     def end(self):
         """MTime object"""
-        if self.has_data:
-            return MTime(self._ts.coords.indexes["time"][-1].isoformat())
+        index, has_data, sr = self._get_time_cache()
+        if has_data:
+            return copy.copy(self._get_endpoints()[1])
         else:
             self.logger.debug(
                 "Data not set yet, pulling end time from " + "metadata.time_period.end"
@@ -717,13 +972,62 @@ class ChannelTS:
 
         return calibrated_ts
 
+    def apply_calibration(self, gain, offset=0.0, inplace=False):
+        """
+        Scale the time series, ts * gain + offset, for example to convert
+        counts to physical units.
+
+        Floating point data are scaled with in place ufuncs so no temporary
+        arrays are made, integer data are converted to float64 first.
+
+        :param gain: multiplicative factor
+        :type gain: float
+        :param offset: value added after scaling, defaults to 0.0
+        :type offset: float, optional
+        :param inplace: scale the data of this channel, defaults to False
+        :type inplace: boolean, optional
+        :return: scaled channel if inplace is False
+        :rtype: :class:`mth5.timeseries.ChannelTS`
+
+        >>> ex_mv = ex.apply_calibration(1.0 / ex.channel_metadata.dipole_length)
+
+        """
+        data = self._ts.data
+        if not isinstance(data, np.ndarray):
+            # lazy data stay lazy
+            scaled = data * gain + offset
+        else:
+            dtype = data.dtype if data.dtype.kind in "fc" else np.float64
+            if inplace and dtype == data.dtype and data.flags.writeable:
+                scaled = data
+            else:
+                scaled = np.empty(data.shape, dtype=dtype)
+            np.multiply(data, gain, out=scaled, casting="unsafe")
+            if offset != 0:
+                np.add(scaled, offset, out=scaled, casting="unsafe")
+
+        if inplace:
+            if scaled is not data:
+                self._ts = self._ts.copy(data=scaled)
+            return
+
+        return ChannelTS(
+            channel_type=self.channel_type,
+            data=self._ts.copy(data=scaled),
+            channel_metadata=self.channel_metadata,
+            run_metadata=self.run_metadata,
+            station_metadata=self.station_metadata,
+            _trusted=True,
+        )
+
     def get_slice(self, start, end=None, n_samples=None):
         """
         Get a slice from the time series given a start and end time.
 
-        Looks for >= start & <= end
+        Looks for >= start & < end
 
-        Uses loc to be exact with milliseconds
+        The bounds are found with a binary search on the time index, which
+        is exact to the nanosecond.
 
         :param start: DESCRIPTION
         :type start: TYPE
@@ -750,10 +1054,18 @@ class ChannelTS:
         if end is not None:
             if not isinstance(end, MTime):
                 end = MTime(end)
-        new_ts = self._ts.loc[
-            (self._ts.indexes["time"] >= start.iso_no_tz)
-            & (self._ts.indexes["time"] < end.iso_no_tz)
-        ]
+        index = self._get_time_cache()[0]
+        if isinstance(index, pd.DatetimeIndex) and index.is_monotonic_increasing:
+            # binary search for the bounds, the slice is a view of the data,
+            # bounds are made in the time zone of the index
+            bounds = [
+                pd.Timestamp(start.iso_no_tz, tz=index.tz),
+                pd.Timestamp(end.iso_no_tz, tz=index.tz),
+            ]
+            i_start, i_end = index.searchsorted(bounds, side="left")
+            new_ts = self._ts.isel(time=slice(i_start, i_end))
+        else:
+            new_ts = self._ts.loc[(index >= start.iso_no_tz) & (index < end.iso_no_tz)]
 
         new_ch_ts = ChannelTS(
             channel_type=self.channel_type,
@@ -761,6 +1073,7 @@ class ChannelTS:
             channel_metadata=self.channel_metadata,
             run_metadata=self.run_metadata,
             station_metadata=self.station_metadata,
+            _trusted=True,
         )
 
         return new_ch_ts
@@ -770,28 +1083,52 @@ class ChannelTS:
         """
         decimate the data by using scipy.signal.decimate
 
+        A zero phase FIR anti-aliasing filter is applied before down sampling,
+        the new time index is computed from the start time and new sample
+        rate.
+
         :param dec_factor: decimation factor
         :type dec_factor: int
 
         * refills ts.data with decimated data and replaces sample_rate
 
         """
+        dec_factor = int(dec_factor)
+        new_sample_rate = self.sample_rate / dec_factor
 
-        new_dt_freq = "{0:.0f}N".format(1e9 / (self.sample_rate / dec_factor))
-
-        new_ts = self._ts.resample(time=new_dt_freq).nearest(tolerance=new_dt_freq)
-        new_ts.attrs["sample_rate"] = self.sample_rate / dec_factor
-        self.channel_metadata.sample_rate = new_ts.attrs["sample_rate"]
+        if dec_factor > 1:
+            data = signal.decimate(
+                self._ts.values, dec_factor, ftype="fir", zero_phase=True
+            )
+        else:
+            data = self._ts.values.copy()
+        new_dt = make_dt_coordinates(
+            self.start, new_sample_rate, data.size, self.logger
+        )
+        new_ts = xr.DataArray(
+            data,
+            coords=[("time", new_dt)],
+            name="ts",
+            attrs=dict(self.to_xarray().attrs),
+        )
+        new_ts.attrs["sample_rate"] = new_sample_rate
 
         if inplace:
+            self.channel_metadata.sample_rate = new_sample_rate
             self.ts = new_ts
         else:
             new_ts.attrs.update(
                 self.channel_metadata.to_dict()[self.channel_metadata._class_name]
             )
+            new_ts.attrs["sample_rate"] = new_sample_rate
             # return new_ts
             return ChannelTS(
-                self.channel_metadata.type, data=new_ts, metadata=self.channel_metadata
+                channel_type=self.channel_type,
+                data=new_ts,
+                channel_metadata=self.channel_metadata,
+                run_metadata=self.run_metadata,
+                station_metadata=self.station_metadata,
+                _trusted=True,
             )
 
     def to_xarray(self):
@@ -827,13 +1164,14 @@ class ChannelTS:
 
         """
 
-        obspy_trace = Trace(self.ts)
-        obspy_trace.stats.channel = fdsn_tools.make_channel_code(self.channel_metadata)
-        obspy_trace.stats.starttime = self.start.iso_str
-        obspy_trace.stats.sampling_rate = self.sample_rate
-        obspy_trace.stats.station = self.station_metadata.fdsn.id
+        header = make_obspy_header(
+            self.channel_metadata,
+            self.start,
+            self.sample_rate,
+            self.station_metadata.fdsn.id,
+        )
 
-        return obspy_trace
+        return Trace(self.ts, header=header)
 
     def from_obspy_trace(self, obspy_trace):
         """
@@ -848,11 +1186,11 @@ class ChannelTS:
             self.logger.error(msg)
             raise MTTSError(msg)
         if obspy_trace.stats.channel[1].lower() in ["e", "q"]:
-            self.channel_metadata = metadata.Electric()
+            self.channel_metadata = new_metadata("Electric")
         elif obspy_trace.stats.channel[1].lower() in ["h", "b", "f"]:
-            self.channel_metadata = metadata.Magnetic()
+            self.channel_metadata = new_metadata("Magnetic")
         else:
-            self.channel_metadata = metadata.Auxiliary()
+            self.channel_metadata = new_metadata("Auxiliary")
         mt_code = fdsn_tools.make_mt_channel(
             fdsn_tools.read_channel_code(obspy_trace.stats.channel)
         )
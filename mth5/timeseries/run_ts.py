@@ -18,26 +18,31 @@ convert them back if read in.
 # ==============================================================================
 # Imports
 # ==============================================================================
-import inspect
 
 import xarray as xr
 import numpy as np
-
-from matplotlib import pyplot as plt
+import pandas as pd
 
 from mt_metadata import timeseries as metadata
 from mt_metadata.utils.mttime import MTime
 
 from mth5.utils.exceptions import MTTSError
-from .channel_ts import ChannelTS
+from .channel_ts import (
+    ChannelTS,
+    new_metadata,
+    datetime64_to_mtime,
+    get_channel_type,
+    make_obspy_header,
+)
 from mth5.utils.mth5_logger import setup_logger
+from mth5.helpers import get_module_classes, copy_metadata
 
-from obspy.core import Stream
+from obspy.core import Stream, Trace
 
 # =============================================================================
 # make a dictionary of available metadata classes
 # =============================================================================
-meta_classes = dict(inspect.getmembers(metadata, inspect.isclass))
+meta_classes = get_module_classes(metadata)
 
 
 # =============================================================================
@@ -54,9 +59,15 @@ class RunTS:
     def __init__(self, array_list=None, run_metadata=None, station_metadata=None):
 
         self.logger = setup_logger(f"{__name__}.{self.__class__.__name__}")
-        self.run_metadata = metadata.Run()
-        self.station_metadata = metadata.Station()
+        self.run_metadata = new_metadata("Run")
+        self.station_metadata = new_metadata("Station")
         self._dataset = xr.Dataset()
+        # (time index, sample rate) of the last sample rate estimate
+        self._sample_rate_cache = (None, None)
+        # (dataset, number of variables, channel names) of the last lookup
+        self._channels_cache = (None, 0, ())
+        # ChannelTS objects returned for each channel name
+        self._channel_ts_cache = {}
 
         # load the arrays first this will write run and station metadata
         if array_list is not None:
@@ -71,7 +82,8 @@ class RunTS:
                 self.run_metadata.from_dict(run_metadata)
 
             elif isinstance(run_metadata, metadata.Run):
-                self.run_metadata.from_dict(run_metadata.to_dict())
+                if not copy_metadata(run_metadata, self.run_metadata):
+                    self.run_metadata.from_dict(run_metadata.to_dict())
             else:
                 msg = (
                     "Input metadata must be a dictionary or Run object, "
@@ -83,7 +95,8 @@ class RunTS:
         # add station metadata, this will be important when propogating a run
         if station_metadata is not None:
             if isinstance(station_metadata, metadata.Station):
-                self.station_metadata.from_dict(station_metadata.to_dict())
+                if not copy_metadata(station_metadata, self.station_metadata):
+                    self.station_metadata.from_dict(station_metadata.to_dict())
 
             elif isinstance(station_metadata, dict):
                 if "Station" not in list(station_metadata.keys()):
@@ -132,34 +145,63 @@ class RunTS:
 
                 # if a channelTS is input then it comes with run and station metadata
                 # use those first, then the user can update later.
-                self.run_metadata.channels.append(item.channel_metadata)
                 if index == 0:
-                    self.station_metadata.from_dict(item.station_metadata.to_dict())
-                    self.run_metadata.from_dict(item.run_metadata.to_dict())
+                    if not copy_metadata(item.station_metadata, self.station_metadata):
+                        self.station_metadata.from_dict(item.station_metadata.to_dict())
+                    if not copy_metadata(item.run_metadata, self.run_metadata):
+                        self.run_metadata.from_dict(item.run_metadata.to_dict())
                 else:
                     self.station_metadata.update(item.station_metadata, match=["id"])
                     self.run_metadata.update(item.run_metadata, match=["id"])
+                # after the run metadata is copied, otherwise the first
+                # channel is overwritten
+                self.run_metadata.channels.append(item.channel_metadata)
             else:
                 valid_list.append(item)
 
-        # probably should test for sampling rate.
-        sr_test = dict([(item.component, (item.sample_rate)) for item in valid_list])
+            # probably should test for sampling rate, stop at the first one
+            # that is different
+            if index == 0:
+                sample_rate = valid_list[0].sample_rate
+            elif valid_list[-1].sample_rate != sample_rate:
+                sr_test = dict([(x.component, x.sample_rate) for x in valid_list])
+                msg = f"sample rates are not all the same {sr_test}"
+                self.logger.error(msg)
+                raise MTTSError(msg)
 
-        if len(set([v for k, v in sr_test.items()])) != 1:
-            msg = f"sample rates are not all the same {sr_test}"
+        if not valid_list:
+            msg = "array_list must have at least one channel"
             self.logger.error(msg)
             raise MTTSError(msg)
 
         return valid_list
 
     def __getattr__(self, name):
-        # change to look for keys directly and use type to set channel type
-        if name in self.dataset.keys():
-            return ChannelTS(self.dataset[name].attrs["type"], self.dataset[name])
+        # private and special names are never channels, checking them first
+        # also keeps a missing _dataset from recursing through self.dataset
+        if name[0] == "_":
+            raise AttributeError(name)
+        # change to look for keys directly and use type to set channel type,
+        # only data variables are channels, not the time coordinate
+        if name in self._dataset.data_vars:
+            # reading the metadata back from the attributes is the slow part,
+            # reuse the ChannelTS as long as it holds the same variable and
+            # time index as the dataset
+            ch = self._channel_ts_cache.get(name)
+            if (
+                ch is not None
+                and ch._ts.variable is self._dataset.variables[name]
+                and ch._ts.indexes["time"] is self._dataset.indexes["time"]
+            ):
+                return ch
+            ch = ChannelTS(
+                self._get_channel_type(name, self._dataset.variables[name].attrs),
+                self._dataset[name],
+            )
+            self._channel_ts_cache[name] = ch
+            return ch
         else:
             # this is a hack for now until figure out who is calling shape, size
-            if name[0] == "_":
-                return None
             if name not in ["shape", "size"]:
                 try:
                     return super().__getattribute__(name)
@@ -175,12 +217,24 @@ class RunTS:
                     self.logger.error(msg)
                     raise NameError(msg)
 
+    def _sync_channel_metadata(self):
+        """
+        Write the metadata of ChannelTS objects returned by attribute access
+        back to the attributes of their dataset variables, so metadata edits
+        made on `run.ex` are seen through the dataset.
+        """
+        for name, ch in self._channel_ts_cache.items():
+            if (
+                name in self._dataset.data_vars
+                and ch._ts.variable is self._dataset.variables[name]
+            ):
+                ch._update_xarray_metadata()
+
     @property
     def has_data(self):
         """check to see if there is data"""
-        if len(self.channels) > 0:
-            return True
-        return False
+        # the number of data variables is known without listing them
+        return len(self._dataset.data_vars) > 0
 
     @property
     def summarize_metadata(self):
@@ -192,12 +246,16 @@ class RunTS:
         :rtype: TYPE
 
         """
-        meta_dict = {}
-        for comp in self.dataset.data_vars:
-            for mkey, mvalue in self.dataset[comp].attrs.items():
-                meta_dict[f"{comp}.{mkey}"] = mvalue
-
-        return meta_dict
+        self._sync_channel_metadata()
+        # read the attributes from the variables, indexing the dataset would
+        # build a new DataArray for every channel
+        return dict(
+            [
+                (f"{comp}.{mkey}", mvalue)
+                for comp, variable in self._dataset.data_vars.variables.items()
+                for mkey, mvalue in variable.attrs.items()
+            ]
+        )
 
     def validate_metadata(self):
         """
@@ -246,21 +304,197 @@ class RunTS:
                     self.logger.warning(msg)
                 self.run_metadata.sample_rate = self.sample_rate
 
-            # update channels recorded
-            self.run_metadata.channels_recorded_auxiliary = []
-            self.run_metadata.channels_recorded_electric = []
-            self.run_metadata.channels_recorded_magnetic = []
+            # update channels recorded, these lists are made from the channel
+            # metadata in run_metadata.channels, so add the missing channels
+            recorded = set([ch.component for ch in self.run_metadata.channels])
             for ch in self.channels:
-                if ch[0] in ["e"]:
-                    self.run_metadata.channels_recorded_electric.append(ch)
-                elif ch[0] in ["h", "b"]:
-                    self.run_metadata.channels_recorded_magnetic.append(ch)
-                else:
-                    self.run_metadata.channels_recorded_auxiliary.append(ch)
+                if ch not in recorded:
+                    ch_type = self._get_channel_type(
+                        ch, self._dataset.variables[ch].attrs
+                    )
+                    ch_metadata = new_metadata(ch_type.capitalize())
+                    ch_metadata.component = ch
+                    self.run_metadata.channels.append(ch_metadata)
 
             self.station_metadata.runs.append(self.run_metadata)
 
-    def set_dataset(self, array_list, align_type="outer"):
+    @staticmethod
+    def _get_channel_type(component, attrs):
+        """
+        Get the channel type of a channel in the dataset, the type attribute
+        is set when the channel is added, fall back to the first letter of
+        the component.
+
+        :param component: channel component
+        :type component: string
+        :param attrs: attributes of the channel variable
+        :type attrs: dictionary
+        :return: [ electric | magnetic | auxiliary ]
+        :rtype: string
+
+        """
+        ch_type = attrs.get("type")
+        if ch_type:
+            return ch_type
+        return get_channel_type(component)
+
+    @staticmethod
+    def _align_time_series(x_array_list, align_type):
+        """
+        Align 1-D time series on a common time index with numpy, same result
+        as :func:`xarray.align` without building intermediate aligned arrays.
+
+        Only in-memory numeric arrays with a single monotonic time coordinate
+        are aligned here, for anything else None is returned and the arrays
+        should be aligned with :func:`xarray.align`.
+
+        :param x_array_list: list of xarrays
+        :type x_array_list: list of :class:`xarray.DataArray`
+        :param align_type: [ outer | inner | left | right ]
+        :type align_type: string
+        :return: common time index, dictionary of variables keyed by component
+        :rtype: tuple (:class:`pandas.DatetimeIndex`, dict) or None
+
+        """
+        if align_type not in ["outer", "inner", "left", "right"]:
+            return None
+        index_list = []
+        for x in x_array_list:
+            if x.dims != ("time",) or list(x.coords) != ["time"]:
+                return None
+            if not isinstance(x.data, np.ndarray) or x.dtype.kind not in "iufc":
+                return None
+            index = x.indexes["time"]
+            if not (index.is_monotonic_increasing and index.is_unique):
+                return None
+            index_list.append(index)
+
+        time_index = index_list[0]
+        if align_type == "right":
+            time_index = index_list[-1]
+        elif align_type in ["outer", "inner"]:
+            regular_index = RunTS._join_regular_time_index(index_list, align_type)
+            if regular_index is not None:
+                time_index = regular_index
+            else:
+                for index in index_list[1:]:
+                    if index is time_index or index.equals(time_index):
+                        continue
+                    if align_type == "outer":
+                        time_index = time_index.union(index)
+                    else:
+                        time_index = time_index.intersection(index)
+
+        xdict = {}
+        for x, index in zip(x_array_list, index_list):
+            data = x.data
+            if index is not time_index and not index.equals(time_index):
+                data = RunTS._reindex_data(data, index, time_index)
+            xdict[x.component.lower()] = xr.Variable(("time",), data, attrs=x.attrs)
+
+        return time_index, xdict
+
+    @staticmethod
+    def _join_regular_time_index(index_list, align_type):
+        """
+        Join time indexes sampled on one regular grid with integer sample
+        arithmetic, same as the union or intersection of the indexes but
+        without merging them.
+
+        :param index_list: time indexes to join
+        :type index_list: list of :class:`pandas.DatetimeIndex`
+        :param align_type: [ outer | inner ]
+        :type align_type: string
+        :return: joined time index, None if the indexes are not on one
+            regular grid, the union would have gaps or the intersection is
+            empty
+        :rtype: :class:`pandas.DatetimeIndex` or None
+
+        """
+        first = index_list[0].asi8
+        if first.size < 2:
+            return None
+        step = first[1] - first[0]
+        starts = []
+        ends = []
+        for index in index_list:
+            values = index.asi8
+            if values.size < 2 or (values[0] - first[0]) % step != 0:
+                return None
+            if not (np.diff(values) == step).all():
+                return None
+            starts.append(values[0])
+            ends.append(values[-1])
+
+        if align_type == "outer":
+            # no gaps if each series starts within a sample of the ones before
+            order = np.argsort(starts)
+            t_start = starts[order[0]]
+            t_end = ends[order[0]]
+            for ii in order[1:]:
+                if starts[ii] > t_end + step:
+                    return None
+                t_end = max(t_end, ends[ii])
+        else:
+            t_start = max(starts)
+            t_end = min(ends)
+            if t_end < t_start:
+                return None
+
+        dt_ns = np.arange((t_end - t_start) // step + 1, dtype=np.int64)
+        dt_ns *= step
+        dt_ns += t_start
+        return pd.DatetimeIndex(dt_ns.view("datetime64[ns]"), copy=False)
+
+    @staticmethod
+    def _reindex_data(data, index, time_index):
+        """
+        Put data onto a new time index, samples with no data are filled with
+        nan.  Both indexes are monotonic, so where samples overlap they
+        usually line up as one block that is copied as a slice.
+
+        :param data: time series data
+        :type data: :class:`numpy.ndarray`
+        :param index: time index of the data
+        :type index: :class:`pandas.DatetimeIndex`
+        :param time_index: new time index
+        :type time_index: :class:`pandas.DatetimeIndex`
+        :return: data on the new time index
+        :rtype: :class:`numpy.ndarray`
+
+        """
+        # same promotion as xarray to fill missing values with nan
+        fill_dtype = np.promote_types(data.dtype, np.float32)
+        if index.size > 0 and time_index.size > 0:
+            # compare as int64 nanoseconds instead of timestamps
+            index_ns = index.asi8
+            time_ns = time_index.asi8
+            i_start = time_ns.searchsorted(index_ns[0])
+            j_start = index_ns.searchsorted(time_ns[0])
+            n_overlap = min(time_index.size - i_start, index.size - j_start)
+            if n_overlap <= 0:
+                return np.full(time_index.size, np.nan, dtype=fill_dtype)
+            if np.array_equal(
+                time_ns[i_start : i_start + n_overlap],
+                index_ns[j_start : j_start + n_overlap],
+            ):
+                if n_overlap == time_index.size:
+                    return data[j_start : j_start + n_overlap]
+                new_data = np.full(time_index.size, np.nan, dtype=fill_dtype)
+                new_data[i_start : i_start + n_overlap] = data[
+                    j_start : j_start + n_overlap
+                ]
+                return new_data
+
+        indexer = index.get_indexer(time_index)
+        missing = indexer < 0
+        data = data.take(indexer)
+        if missing.any():
+            data = data.astype(fill_dtype)
+            data[missing] = np.nan
+        return data
+
+    def set_dataset(self, array_list, align_type="outer", validate=True):
         """
 
         :param array_list: list of xarrays
@@ -276,22 +510,37 @@ class RunTS:
             be those of the first object with that dimension. Indexes for
             the same dimension must have the same size in all objects.
         :type align_type: string
+        :param validate: update the run metadata from the dataset, set to
+            False when the metadata is already correct or will be validated
+            later with :meth:`validate_metadata`, defaults to True
+        :type validate: bool, optional
 
         """
         if isinstance(array_list, (list, tuple)):
             x_array_list = self._validate_array_list(array_list)
 
-            # first need to align the time series.
-            x_array_list = xr.align(*x_array_list, join=align_type)
+            # align with numpy on a common time index and build the dataset
+            # once, xr.align and the merge in xr.Dataset copy and compare
+            # every index again
+            aligned = self._align_time_series(x_array_list, align_type)
+            if aligned is not None:
+                time_index, xdict = aligned
+                self._dataset = xr.Dataset(xdict, coords={"time": time_index})
+            else:
+                # first need to align the time series.
+                x_array_list = xr.align(*x_array_list, join=align_type)
 
-            # input as a dictionary
-            xdict = dict([(x.component.lower(), x) for x in x_array_list])
-            self._dataset = xr.Dataset(xdict)
+                # input as a dictionary
+                xdict = dict([(x.component.lower(), x) for x in x_array_list])
+                self._dataset = xr.Dataset(xdict)
 
         elif isinstance(array_list, xr.Dataset):
             self._dataset = array_list
 
-        self.validate_metadata()
+        self._channels_cache = (None, 0, ())
+        self._channel_ts_cache = {}
+        if validate:
+            self.validate_metadata()
         self._dataset.attrs.update(self.run_metadata.to_dict(single=True))
 
     def add_channel(self, channel):
@@ -307,6 +556,7 @@ class RunTS:
         If the start time is not the same nan's will be placed at locations where the
         timing does not match the current start time.  This is a feature of xarray.
 
+        To add several channels use :meth:`add_channels`.
 
         :param channel: a channel xarray or ChannelTS to add to the run
         :type channel: :class:`xarray.DataArray` or :class:`mth5.timeseries.ChannelTS`
@@ -314,30 +564,59 @@ class RunTS:
 
         """
 
-        if isinstance(channel, xr.DataArray):
-            c = ChannelTS()
-            c.ts = channel
-        elif isinstance(channel, ChannelTS):
-            c = channel
-            self.run_metadata.channels.append(c.channel_metadata)
-        else:
-            raise ValueError("Input Channel must be type xarray.DataArray or ChannelTS")
+        self.add_channels([channel])
 
-        ### need to validate the channel to make sure sample rate is the same
-        if c.sample_rate != self.sample_rate:
-            msg = (
-                f"Channel sample rate is not correct, current {self.sample_rate} "
-                + f"input {c.sample_rate}"
-            )
-            self.logger.error(msg)
-            raise MTTSError(msg)
+    def add_channels(self, channels):
+        """
+        Add several channels to the dataset at once, each can be an
+        :class:`xarray.DataArray` or :class:`mth5.timeseries.ChannelTS` object.
+
+        Same as :meth:`add_channel` for each channel, but the channels are
+        aligned with the dataset in one update instead of one per channel.
+
+        :param channels: channel xarrays or ChannelTS objects to add to the run
+        :type channels: list of :class:`xarray.DataArray` or
+            :class:`mth5.timeseries.ChannelTS`
+
+        """
+
+        ch_list = []
+        metadata_list = []
+        for channel in channels:
+            if isinstance(channel, xr.DataArray):
+                c = ChannelTS()
+                c.ts = channel
+            elif isinstance(channel, ChannelTS):
+                c = channel
+                metadata_list.append(c.channel_metadata)
+            else:
+                raise ValueError(
+                    "Input Channel must be type xarray.DataArray or ChannelTS"
+                )
+
+            ### need to validate the channel to make sure sample rate is the same
+            if c.sample_rate != self.sample_rate:
+                msg = (
+                    f"Channel sample rate is not correct, current {self.sample_rate} "
+                    + f"input {c.sample_rate}"
+                )
+                self.logger.error(msg)
+                raise MTTSError(msg)
+            ch_list.append(c)
 
         ### should probably check for other metadata like station and run?
 
-        self._dataset[c.component] = c.ts
+        self.run_metadata.channels.extend(metadata_list)
+        # keep edits made on returned channels before the cache is cleared
+        self._sync_channel_metadata()
+        # one update aligns all the channels with the dataset at once
+        self._dataset.update(dict([(c.component, c.to_xarray()) for c in ch_list]))
+        self._channels_cache = (None, 0, ())
+        self._channel_ts_cache = {}
 
     @property
     def dataset(self):
+        self._sync_channel_metadata()
         return self._dataset
 
     @dataset.setter
@@ -352,27 +631,27 @@ class RunTS:
     @property
     def start(self):
         if self.has_data:
-            return MTime(self.dataset.coords["time"].to_index()[0].isoformat())
+            return datetime64_to_mtime(self._dataset.indexes["time"].values[0])
         return self.run_metadata.time_period.start
 
     @property
     def end(self):
         if self.has_data:
-            return MTime(self.dataset.coords["time"].to_index()[-1].isoformat())
+            return datetime64_to_mtime(self._dataset.indexes["time"].values[-1])
         return self.run_metadata.time_period.end
 
     @property
     def sample_rate(self):
         if self.has_data:
             try:
-                return 1.0 / np.float64(
-                    (
-                        np.median(
-                            np.diff(self.dataset.coords["time"].to_index())
-                            / np.timedelta64(1, "s")
-                        )
-                    )
-                )
+                # the estimate scans the whole index, only redo it when the
+                # time index of the dataset changes
+                index = self._dataset.indexes["time"]
+                if self._sample_rate_cache[0] is not index:
+                    # differences in int64 nanoseconds
+                    sr = 1.0 / (np.median(np.diff(index.asi8)) / 1e9)
+                    self._sample_rate_cache = (index, sr)
+                return self._sample_rate_cache[1]
             except AttributeError:
                 self.logger.warning("Something weird happend with xarray time indexing")
 
@@ -394,7 +673,39 @@ class RunTS:
 
     @property
     def channels(self):
-        return [cc for cc in list(self.dataset.data_vars)]
+        """
+        Channel names in the dataset, looked up again only when the dataset
+        or its number of variables changes.
+        """
+        n_variables = len(self._dataset.variables)
+        if (
+            self._channels_cache[0] is not self._dataset
+            or self._channels_cache[1] != n_variables
+        ):
+            self._channels_cache = (
+                self._dataset,
+                n_variables,
+                tuple(self._dataset.data_vars),
+            )
+        return list(self._channels_cache[2])
+
+    def to_array(self):
+        """
+        Stack the channels into one 2-D array with a row for each channel,
+        for operations across channels that want one contiguous array
+        instead of a DataArray per channel.  This is a copy of the data.
+
+        :return: channel names in row order, data of shape
+            (number of channels, number of samples)
+        :rtype: tuple, :class:`numpy.ndarray`
+
+        """
+        channels = tuple(self.channels)
+        if not channels:
+            return channels, np.empty((0, 0))
+        return channels, np.stack(
+            [self._dataset.variables[ch].values for ch in channels]
+        )
 
     def to_obspy_stream(self):
         """
@@ -406,16 +717,22 @@ class RunTS:
 
         """
 
+        self._sync_channel_metadata()
+        # the trace header only needs the channel code, start time and sample
+        # rate, make them from the dataset instead of a ChannelTS per channel
+        sample_rate = np.round(self.sample_rate, 0)
+        start = self.start
+        station_id = self.station_metadata.fdsn.id
         trace_list = []
-        for channel in self.channels:
-            if channel[0] in ["e"]:
-                ch_type = "electric"
-            elif channel[0] in ["h", "b"]:
-                ch_type = "magnetic"
-            else:
-                ch_type = "auxiliary"
-            ts_obj = ChannelTS(ch_type, self.dataset[channel])
-            trace_list.append(ts_obj.to_obspy_trace())
+        for channel, variable in self._dataset.data_vars.variables.items():
+            ch_type = self._get_channel_type(channel, variable.attrs)
+            ch_metadata = new_metadata(ch_type.capitalize())
+            for key in ["type", "component", "measurement_azimuth", "measurement_tilt"]:
+                if variable.attrs.get(key) is not None:
+                    setattr(ch_metadata, key, variable.attrs[key])
+            ch_metadata.sample_rate = sample_rate
+            header = make_obspy_header(ch_metadata, start, sample_rate, station_id)
+            trace_list.append(Trace(data=variable.values, header=header))
 
         return Stream(traces=trace_list)
 
@@ -509,7 +826,7 @@ class RunTS:
         new_runts = RunTS()
         new_runts.station_metadata = self.station_metadata
         new_runts.run_metadata = self.run_metadata
-        new_runts.dataset = self._dataset.sel(
+        new_runts.dataset = self.dataset.sel(
             time=slice(start.iso_no_tz, end.iso_no_tz)
         )
 
@@ -525,6 +842,8 @@ class RunTS:
 
         """
 
+        from matplotlib import pyplot as plt
+
         n_channels = len(self.channels)
 
         fig = plt.figure()
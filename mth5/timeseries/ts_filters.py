@@ -9,8 +9,6 @@ time series filters
 import numpy as np
 from scipy import signal
 
-from matplotlib import pyplot as plt
-from matplotlib.lines import Line2D
 from mth5.utils.mth5_logger import setup_logger
 
 logger = setup_logger(__file__)
@@ -183,6 +181,8 @@ class RemoveInstrumentResponse:
         :type label: string
 
         """
+        from matplotlib.lines import Line2D
+
         ax_t = self.fig.get_axes()[0]
         ax_f = self.fig.get_axes()[1]
         ax = self.fig.add_subplot(self.nrows, 2, num, sharex=ax_t)
@@ -343,6 +343,8 @@ class RemoveInstrumentResponse:
         ]
         data = data * w
         if self.plot:
+            from matplotlib.lines import Line2D
+
             f = np.fft.rfftfreq(2 * data.size, d=self.sample_interval)[1:]
             ax_t = self.fig.get_axes()[0]
             ax_f = self.fig.get_axes()[1]
@@ -442,6 +444,8 @@ class RemoveInstrumentResponse:
         f = np.fft.rfftfreq(ts.size, d=self.sample_interval)
         step = 1
         if self.plot:
+            from matplotlib import pyplot as plt
+
             self.subplot_dict = self._get_subplot_count()
             self.fig = plt.figure(figsize=[10, 12])
             self.fig.clf()
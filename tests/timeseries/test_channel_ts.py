@@ -69,11 +69,31 @@ class TestChannelTS(unittest.TestCase):
         with self.subTest(name="compnent in attrs"):
             self.assertEqual(self.ts._ts.attrs["component"], "ex")
 
+    def test_intialize_with_metadata_objects(self):
+        run = metadata.Run(id="a")
+        run.channels.append(metadata.Electric(component="ex"))
+        run.channels.append(metadata.Magnetic(component="hx"))
+        station = metadata.Station(id="mt01")
+        station.runs.append(metadata.Run(id="a"))
+        station.runs.append(metadata.Run(id="b"))
+        self.ts = timeseries.ChannelTS(
+            "electric", run_metadata=run, station_metadata=station
+        )
+        with self.subTest(name="channels recorded"):
+            self.assertListEqual(
+                ["ex", "hx"], self.ts.run_metadata.channels_recorded_all
+            )
+        with self.subTest(name="run list"):
+            self.assertListEqual(["a", "b"], self.ts.station_metadata.run_list)
+        with self.subTest(name="channels not shared"):
+            self.assertIsNot(run.channels[0], self.ts.run_metadata.channels[0])
+
     def test_numpy_input(self):
         self.ts.channel_metadata.sample_rate = 1.0
         self.ts._update_xarray_metadata()
 
-        self.ts.ts = np.random.rand(4096)
+        data = np.random.rand(4096)
+        self.ts.ts = data
         end = self.ts.channel_metadata.time_period._start_dt + (4096 - 1)
 
         # check to make sure the times align
@@ -88,6 +108,8 @@ class TestChannelTS(unittest.TestCase):
             )
         with self.subTest(name="has n samples"):
             self.assertEqual(self.ts.n_samples, 4096)
+        with self.subTest(name="not copied"):
+            self.assertTrue(np.shares_memory(data, self.ts.ts))
 
     def test_numpy_input_fail(self):
         self.ts.channel_metadata.sample_rate = 1.0
@@ -185,6 +207,119 @@ class TestChannelTS(unittest.TestCase):
         with self.subTest(name="sample_interval"):
             self.assertEqual(self.ts.sample_interval, 1.0 / 8.0)
 
+    def test_change_start(self):
+        self.ts.sample_rate = 16
+        self.ts.start = "2020-01-01T12:00:00"
+        self.ts.ts = np.arange(4096)
+        self.assertEqual(self.ts.end, "2020-01-01T12:04:15.937500+00:00")
+
+        self.ts.start = "2020-01-02T12:00:00"
+        with self.subTest(name="start"):
+            self.assertEqual(self.ts.start, "2020-01-02T12:00:00+00:00")
+        with self.subTest(name="end"):
+            self.assertEqual(self.ts.end, "2020-01-02T12:04:15.937500+00:00")
+        with self.subTest(name="sample_rate"):
+            self.assertEqual(self.ts.sample_rate, 16.0)
+
+    def test_resample(self):
+        self.ts.sample_rate = 16
+        self.ts.start = "2020-01-01T12:00:00"
+        self.ts.ts = np.sin(2 * np.pi * 0.5 * np.arange(4096) / 16.0)
+
+        new_ts = self.ts.resample(4)
+        with self.subTest(name="sample_rate"):
+            self.assertEqual(new_ts.sample_rate, 4.0)
+        with self.subTest(name="n_samples"):
+            self.assertEqual(new_ts.n_samples, 1024)
+        with self.subTest(name="start"):
+            self.assertEqual(new_ts.start, self.ts.start)
+        with self.subTest(name="original unchanged"):
+            self.assertEqual(self.ts.sample_rate, 16.0)
+        with self.subTest(name="data"):
+            self.assertTrue(
+                np.allclose(new_ts.ts[50:-50], self.ts.ts[::4][50:-50], atol=1e-2)
+            )
+
+    def test_apply_calibration(self):
+        self.ts.sample_rate = 16
+        self.ts.start = "2020-01-01T12:00:00"
+        self.ts.ts = np.arange(4096)
+
+        new_ts = self.ts.apply_calibration(2.0, offset=1.0)
+        with self.subTest(name="scaled"):
+            self.assertTrue(np.allclose(new_ts.ts, np.arange(4096) * 2.0 + 1.0))
+        with self.subTest(name="original unchanged"):
+            self.assertTrue(np.array_equal(self.ts.ts, np.arange(4096)))
+        with self.subTest(name="start"):
+            self.assertEqual(new_ts.start, self.ts.start)
+
+        self.ts.apply_calibration(0.5, inplace=True)
+        with self.subTest(name="inplace"):
+            self.assertTrue(np.allclose(self.ts.ts, np.arange(4096) * 0.5))
+
+    def test_from_obspy_trace_dtype(self):
+        for dtype, data in [
+            (np.int32, np.arange(4096, dtype=np.int32)),
+            (np.float64, np.arange(4096.0)),
+        ]:
+            ex = timeseries.ChannelTS(
+                "electric", channel_metadata={"electric": {"component": "ex"}}
+            )
+            ex.sample_rate = 16
+            ex.start = "2020-01-01T12:00:00"
+            ex.ts = data
+
+            new_ts = timeseries.ChannelTS()
+            new_ts.from_obspy_trace(ex.to_obspy_trace())
+            with self.subTest(name=np.dtype(dtype).name):
+                self.assertEqual(new_ts.ts.dtype, dtype)
+
+    def test_to_obspy_trace(self):
+        self.ts = timeseries.ChannelTS(
+            "electric", channel_metadata={"electric": {"component": "ex"}}
+        )
+        self.ts.sample_rate = 16
+        self.ts.start = "2020-01-01T12:00:00"
+        self.ts.ts = np.random.rand(4096)
+
+        trace = self.ts.to_obspy_trace()
+        with self.subTest(name="starttime"):
+            self.assertEqual(trace.stats.starttime.isoformat(), "2020-01-01T12:00:00")
+        with self.subTest(name="sampling_rate"):
+            self.assertEqual(trace.stats.sampling_rate, 16.0)
+        with self.subTest(name="not copied"):
+            self.assertTrue(np.shares_memory(trace.data, self.ts.ts))
+
+    def test_equal(self):
+        self.ts.sample_rate = 16
+        self.ts.start = "2020-01-01T12:00:00"
+        self.ts.ts = np.random.rand(4096)
+
+        other = timeseries.ChannelTS(
+            "auxiliary",
+            data=self.ts.ts.copy(),
+            channel_metadata=self.ts.channel_metadata,
+        )
+        with self.subTest(name="equal"):
+            self.assertTrue(self.ts == other)
+
+        other.ts = self.ts.ts + 1
+        with self.subTest(name="not equal"):
+            self.assertTrue(self.ts != other)
+
+        other.ts[:] = self.ts.ts
+        with self.subTest(name="equal after in place edit"):
+            self.assertTrue(self.ts == other)
+
+    def test_equal_dtype(self):
+        self.ts.ts = np.arange(16)
+        other = timeseries.ChannelTS(
+            "auxiliary",
+            data=np.arange(16, dtype=float),
+            channel_metadata=self.ts.channel_metadata,
+        )
+        self.assertTrue(self.ts == other)
+
     def test_to_xarray(self):
         self.ts.sample_rate = 16
         self.ts.start = "2020-01-01T12:00:00"
@@ -237,6 +372,28 @@ class TestChannelTS(unittest.TestCase):
         with self.subTest(name="end time"):
             new_ts = self.ts.get_slice("2020-01-01T12:00:00", end="2020-01-01T12:00:03")
             self.assertEqual(new_ts.ts.size, 48)
+        with self.subTest(name="metadata not shared"):
+            new_ts = self.ts.get_slice("2020-01-01T12:01:00", n_samples=48)
+            self.assertIsNot(new_ts.channel_metadata, self.ts.channel_metadata)
+            self.assertEqual(self.ts.start, "2020-01-01T12:00:00+00:00")
+
+    def test_time_slice_tz_aware(self):
+        n_samples = 4096
+        self.ts.ts = pd.DataFrame(
+            {"data": np.arange(n_samples)},
+            index=pd.date_range(
+                start="2020-01-01T12:00:00",
+                periods=n_samples,
+                freq="62500000N",
+                tz="UTC",
+            ),
+        )
+
+        new_ts = self.ts.get_slice("2020-01-01T12:00:00", n_samples=48)
+        with self.subTest(name="n samples"):
+            self.assertEqual(new_ts.ts.size, 48)
+        with self.subTest(name="first sample"):
+            self.assertEqual(new_ts.ts[0], 0)
 
 
 # =============================================================================
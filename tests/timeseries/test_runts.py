@@ -22,6 +22,7 @@ import numpy as np
 from mth5.timeseries import ChannelTS, RunTS
 from mth5.utils.exceptions import MTTSError
 
+from mt_metadata import timeseries as metadata
 from mt_metadata.utils.mttime import MTime
 
 # =============================================================================
@@ -104,6 +105,22 @@ class TestRunTS(unittest.TestCase):
             self.assertEqual(self.run.start, MTime(self.start))
         with self.subTest("end"):
             self.assertEqual(self.run.end, MTime(self.end))
+        with self.subTest("channels recorded"):
+            self.run.validate_metadata()
+            self.assertListEqual(
+                ["ex", "ey"], self.run.run_metadata.channels_recorded_electric
+            )
+            self.assertListEqual(
+                ["hx", "hy", "hz"], self.run.run_metadata.channels_recorded_magnetic
+            )
+
+    def test_not_copied(self):
+        for comp in ["ex", "ey", "hx", "hy", "hz"]:
+            ch = getattr(self, comp)
+            with self.subTest(f"dataset {comp}"):
+                self.assertTrue(np.shares_memory(self.run.dataset[comp].data, ch.ts))
+            with self.subTest(f"channel {comp}"):
+                self.assertTrue(np.shares_memory(getattr(self.run, comp).ts, ch.ts))
 
     def test_sr_fail(self):
         self.hz = ChannelTS(
@@ -140,6 +157,116 @@ class TestRunTS(unittest.TestCase):
             with self.subTest("component"):
                 self.assertEqual(ch.component, comp)
 
+    def test_channel_metadata_edit(self):
+        self.run.ex.channel_metadata.measurement_azimuth = 33
+        with self.subTest("channel"):
+            self.assertEqual(self.run.ex.channel_metadata.measurement_azimuth, 33)
+        with self.subTest("dataset attrs"):
+            self.assertEqual(self.run.dataset.ex.attrs["measurement_azimuth"], 33)
+        with self.subTest("summarize metadata"):
+            self.assertEqual(
+                self.run.summarize_metadata["ex.measurement_azimuth"], 33
+            )
+
+    def test_add_channel(self):
+        temperature = ChannelTS(
+            "auxiliary",
+            data=np.random.rand(self.npts),
+            channel_metadata={
+                "auxiliary": {
+                    "component": "temperature",
+                    "sample_rate": self.sample_rate,
+                    "time_period.start": self.start,
+                }
+            },
+        )
+        self.assertListEqual(["ex", "ey", "hx", "hy", "hz"], self.run.channels)
+        self.run.add_channel(temperature)
+        self.assertListEqual(
+            ["ex", "ey", "hx", "hy", "hz", "temperature"], self.run.channels
+        )
+
+    def test_add_channels(self):
+        ch_list = [
+            ChannelTS(
+                "auxiliary",
+                data=np.random.rand(self.npts),
+                channel_metadata={
+                    "auxiliary": {
+                        "component": comp,
+                        "sample_rate": self.sample_rate,
+                        "time_period.start": self.start,
+                    }
+                },
+            )
+            for comp in ["temperature", "battery"]
+        ]
+        self.run.add_channels(ch_list)
+        with self.subTest("channels"):
+            self.assertListEqual(
+                ["ex", "ey", "hx", "hy", "hz", "temperature", "battery"],
+                self.run.channels,
+            )
+        with self.subTest("channels recorded"):
+            self.assertListEqual(
+                ["battery", "temperature"],
+                self.run.run_metadata.channels_recorded_auxiliary,
+            )
+
+    def test_set_dataset_offset(self):
+        self.hz = ChannelTS(
+            "magnetic",
+            data=np.random.rand(self.npts),
+            channel_metadata={
+                "magnetic": {
+                    "component": "hz",
+                    "sample_rate": self.sample_rate,
+                    "time_period.start": "2015-01-08T19:49:19+00:00",
+                }
+            },
+        )
+
+        self.run.set_dataset([self.ex, self.ey, self.hx, self.hy, self.hz])
+        with self.subTest("start"):
+            self.assertEqual(self.run.start, MTime(self.start))
+        with self.subTest("end"):
+            self.assertEqual(self.run.end, MTime("2015-01-08T19:57:50.875000"))
+        with self.subTest("ex filled"):
+            self.assertTrue(np.isnan(self.run.dataset.ex.data[-8:]).all())
+        with self.subTest("hz filled"):
+            self.assertTrue(np.isnan(self.run.dataset.hz.data[:8]).all())
+        with self.subTest("hz data"):
+            self.assertTrue(np.array_equal(self.run.dataset.hz.data[8:], self.hz.ts))
+
+    def test_set_dataset_no_validate(self):
+        self.run.run_metadata.time_period.end = "2020-01-01T00:00:00+00:00"
+        self.run.set_dataset([self.ex, self.ey, self.hx], validate=False)
+        with self.subTest("channels"):
+            self.assertListEqual(["ex", "ey", "hx"], self.run.channels)
+        with self.subTest("channels recorded"):
+            self.assertListEqual(
+                ["ex", "ey", "hx"], self.run.run_metadata.channels_recorded_all
+            )
+        with self.subTest("metadata not updated"):
+            self.assertNotEqual(self.run.end, self.run.run_metadata.time_period.end)
+
+    def test_to_array(self):
+        channels, data = self.run.to_array()
+        with self.subTest("channels"):
+            self.assertTupleEqual(("ex", "ey", "hx", "hy", "hz"), channels)
+        with self.subTest("shape"):
+            self.assertTupleEqual((5, self.npts), data.shape)
+        with self.subTest("data"):
+            self.assertTrue(np.array_equal(self.hx.ts, data[2]))
+
+    def test_to_obspy_stream(self):
+        stream = self.run.to_obspy_stream()
+        for comp, trace in zip(self.run.channels, stream):
+            ch_trace = getattr(self.run, comp).to_obspy_trace()
+            for key in ["channel", "starttime", "sampling_rate", "station"]:
+                with self.subTest(f"{comp} {key}"):
+                    self.assertEqual(trace.stats[key], ch_trace.stats[key])
+
     def test_get_channel_fail(self):
         """
         self.run.temperature should return None, because 'temperature' is not in self.channels
@@ -148,6 +275,29 @@ class TestRunTS(unittest.TestCase):
 
         self.assertRaises(NameError, getattr, *(self.run, "temperature"))
 
+    def test_get_time_fail(self):
+        """
+        self.run.time should fail, 'time' is a coordinate not a channel
+        :return:
+        """
+
+        self.assertRaises(NameError, getattr, *(self.run, "time"))
+
+    def test_initialize_with_metadata_objects(self):
+        run = metadata.Run(id="a")
+        run.channels.append(metadata.Electric(component="ex"))
+        run.channels.append(metadata.Magnetic(component="hx"))
+        station = metadata.Station(id="mt01")
+        station.runs.append(metadata.Run(id="a"))
+        station.runs.append(metadata.Run(id="b"))
+        run_ts = RunTS(run_metadata=run, station_metadata=station)
+        with self.subTest("channels recorded"):
+            self.assertListEqual(
+                ["ex", "hx"], run_ts.run_metadata.channels_recorded_all
+            )
+        with self.subTest("run list"):
+            self.assertListEqual(["a", "b"], run_ts.station_metadata.run_list)
+
     def test_wrong_metadata(self):
         self.run.run_metadata.sample_rate = 10
         self.run.validate_metadata()
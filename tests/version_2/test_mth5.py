@@ -11,6 +11,7 @@ Created on Thu Jun 18 16:54:19 2020
 # =============================================================================
 
 import unittest
+from unittest import mock
 from pathlib import Path
 import numpy as np
 
@@ -104,6 +105,77 @@ class TestMTH5(unittest.TestCase):
         self.assertIn("ex", new_run.groups_list)
         self.assertIsInstance(new_channel, mth5.groups.ElectricDataset)
 
+    def test_add_channel_chunks(self):
+        new_station = self.mth5_obj.add_station("MT001", survey="test")
+        new_run = new_station.add_run("MT001a")
+        new_channel = new_run.add_channel(
+            "Ex", "electric", np.zeros(1000000, dtype=np.int32)
+        )
+        self.assertTupleEqual((262144,), new_channel.hdf5_dataset.chunks)
+
+    def test_add_channel_compression(self):
+        new_station = self.mth5_obj.add_station("MT001", survey="test")
+        new_run = new_station.add_run("MT001a")
+        new_channel = new_run.add_channel(
+            "Ex", "electric", np.zeros(1000, dtype=np.int32)
+        )
+        with self.subTest("compression"):
+            self.assertEqual(
+                self.mth5_obj.dataset_options["compression"],
+                new_channel.hdf5_dataset.compression,
+            )
+        with self.subTest("compression_opts"):
+            self.assertEqual(
+                self.mth5_obj.dataset_options["compression_opts"],
+                new_channel.hdf5_dataset.compression_opts,
+            )
+
+    def test_add_channel_direct(self):
+        new_station = self.mth5_obj.add_station("MT001", survey="test")
+        new_run = new_station.add_run("MT001a")
+        data = np.random.randint(-(2 ** 20), 2 ** 20, 300000, dtype=np.int32)
+        written = []
+
+        def write_direct_chunks(*args, **kwargs):
+            written.append(mth5.helpers.write_direct_chunks(*args, **kwargs))
+            return written[-1]
+
+        with mock.patch(
+            "mth5.groups.master_station_run_channel.write_direct_chunks",
+            write_direct_chunks,
+        ):
+            new_channel = new_run.add_channel(
+                "Ex",
+                "electric",
+                data,
+                direct=True,
+            )
+        with self.subTest("direct chunk write"):
+            self.assertListEqual([True], written)
+        with self.subTest("compression"):
+            self.assertEqual("gzip", new_channel.hdf5_dataset.compression)
+        with self.subTest("fletcher32"):
+            self.assertTrue(new_channel.hdf5_dataset.fletcher32)
+        with self.subTest("data"):
+            self.assertTrue(np.array_equal(data, new_channel.hdf5_dataset[()]))
+
+    def test_iter_chunks(self):
+        new_station = self.mth5_obj.add_station("MT001", survey="test")
+        new_run = new_station.add_run("MT001a")
+        data = np.random.randint(-(2 ** 20), 2 ** 20, 300000, dtype=np.int32)
+        new_channel = new_run.add_channel("Ex", "electric", data)
+        with self.subTest("read direct"):
+            self.assertTrue(mth5.helpers._can_read_direct(new_channel.hdf5_dataset))
+        with mock.patch("os.pread", wraps=mth5.helpers.os.pread) as pread:
+            chunks = [
+                chunk
+                for index, chunk in mth5.helpers.iter_chunks(new_channel.hdf5_dataset)
+            ]
+        with self.subTest("pread"):
+            self.assertTrue(pread.called)
+        with self.subTest("data"):
+            self.assertTrue(np.array_equal(data, np.concatenate(chunks)))
+
     def test_remove_channel(self):
         new_station = self.mth5_obj.add_station("MT001", survey="test")
         new_run = new_station.add_run("MT001a")
@@ -149,6 +221,33 @@ class TestMTH5(unittest.TestCase):
                 channel_ts._ts.time.to_dict(), new_ts._ts.time.to_dict()
             )
 
+    def test_time_in_index(self):
+        channel_ts = ChannelTS(
+            channel_type="electric",
+            data=np.random.rand(100),
+            channel_metadata={
+                "electric": {
+                    "component": "ex",
+                    "time_period.start": "2020-01-01T12:00:00.600000",
+                    "sample_rate": 1,
+                }
+            },
+        )
+        station = self.mth5_obj.add_station("MT002", survey="test")
+        run = station.add_run("MT002a")
+        ex = run.add_channel("Ex", "electric", None)
+        ex.from_channel_ts(channel_ts)
+
+        # samples are at 0.6 s past each second up to 12:01:39.6
+        with self.subTest("sample within the second"):
+            self.assertTrue(ex._time_in_index("2020-01-01T12:00:02"))
+        with self.subTest("exact sample"):
+            self.assertTrue(ex._time_in_index("2020-01-01T12:00:04.600000"))
+        with self.subTest("between samples"):
+            self.assertFalse(ex._time_in_index("2020-01-01T12:00:04.500000"))
+        with self.subTest("last sample is before the second"):
+            self.assertFalse(ex._time_in_index("2020-01-01T12:01:40"))
+
     def test_from_run_ts(self):
         ts_list = []
         for comp in ["ex", "ey", "hx", "hy", "hz"]: